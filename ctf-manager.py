@@ -6,74 +6,409 @@ Main CLI script for managing Terraform-based cloud security challenges
 across AWS, Azure, and GCP platforms.
 """
 
+from __future__ import annotations
+
+import os
 import sys
 import argparse
 import json
+from collections import Counter
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 # Add lib directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "lib"))
 
-from lib import (
-    TerraformManager,
-    ConfigLoader, 
-    CredentialManager,
-    Challenge,
-    get_logger
-)
+# Heavier components (YAML parsing, challenges, Terraform/credential managers,
+# subprocess and thread pools) are imported where they are used, so commands
+# like 'credits' and '--help' start fast
 from lib.logger import setup_logger
-from lib.challenge import ChallengeStatus
+
+if TYPE_CHECKING:
+    from lib.challenge import Challenge, ChallengeStatus
+
+# Worker threads used to overlap Terraform status probes
+STATUS_PROBE_WORKERS = 8
+
+# Subcommands (kept in sync with create_parser) and those taking a challenge name;
+# used by the shell-completion fast path
+_COMMANDS = ('list', 'deploy', 'destroy', 'status', 'output', 'credits')
+_CHALLENGE_COMMANDS = ('deploy', 'destroy', 'status', 'output')
+
+# Preparation script timeout in seconds
+PREP_SCRIPT_TIMEOUT = 300
+
+# Preparation scripts run before 'terraform apply', in execution order
+_PREP_SCRIPTS = (
+    "install_dependencies.sh",
+    "setup.sh",
+    "prepare.sh",
+    "build.sh"
+)
+
+# Status label colors by ChallengeStatus value; anything else is white
+_STATUS_COLORS = {
+    "deployed": "\033[32m",      # Green
+    "not_deployed": "\033[31m",  # Red
+    "unknown": "\033[33m"        # Yellow
+}
+
+
+@lru_cache(maxsize=None)
+def _status_line(status: ChallengeStatus) -> str:
+    """Get the color-coded label for a challenge status"""
+    return _STATUS_COLORS.get(status.value, "\033[37m") + status.value.upper() + "\033[0m"
+
+
+def _dump_json(obj) -> bytes:
+    """Encode an object as indented JSON bytes, using orjson when available"""
+    try:
+        import orjson
+    except ImportError:  # optional, falls back to the stdlib encoder
+        return json.dumps(obj, indent=2).encode()
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
+# Cloud Security Village sponsors as (tier heading, [(name, country), ...])
+_SPONSOR_TIERS = (
+    ("🌟 **Village Core Sponsor**", (
+        ("InterBank", "Peru"),
+    )),
+    ("🛡️  **Village Guardian**", (
+        ("Orca Security", "USA"),
+    )),
+    ("🤝 **Village Partners**", (
+        ("OZ Digital Consulting", "USA"),
+        ("Semilla Cyber", "Puerto Rico"),
+        ("Offensive Security", "USA"),
+        ("Altered Security", "India"),
+        ("Spartan-Cybersecurity", "Colombia"),
+        ("Electronic Cats", "Mexico"),
+        ("CyberWarFare Labs", "India"),
+        ("GISAC", "Colombia"),
+        ("UqBar", "Colombia")
+    )),
+    ("🏗️  **Village Builders**", (
+        ("PlainText", "Dominican Republic"),
+        ("RedTeamRD", "Dominican Republic"),
+        ("AWS Security Latam", "Mexico")
+    )),
+    ("🤝 **Village Allies**", (
+        ("ASC IT GROUP", "Colombia"),
+        ("NicaSecurity", "Nicaragua"),
+        ("nuvem", "Peru")
+    )),
+)
+
+_SPONSORS_TEXT = "\n\n".join(
+    "\n".join([f"   {tier}"] + [f"   • {name} ({country})" for name, country in sponsors])
+    for tier, sponsors in _SPONSOR_TIERS
+)
+
+# Static 'credits' output, rendered once at import
+_CREDITS_TEXT = f"""
+{'='*80}
+ 🏆 HackTheCloud25 - Credits & Acknowledgments
+{'='*80}
+
+🌐 **Cloud Security Space - EkoParty 2025**
+   📅 October 22-24, 2025
+   📍 CEC - Buenos Aires, Argentina
+   🎯 Explore, Learn and Master Cloud Security
+
+   A comprehensive cybersecurity experience focused on cloud environments where
+   professionals and enthusiasts immerse themselves in real attack and defense
+   scenarios across AWS, Azure and GCP. The Cloud Security Village at EkoParty
+   2025 offers hands-on labs, specialized conferences and a comprehensive CTF
+   challenge focused on cloud security.
+
+   🔗 https://cloudsecurityspace.org/
+
+🏥 **MediCloudX - The Fictional Company**
+   An innovative digital health platform that migrated its critical
+   infrastructure to the cloud to provide cutting-edge medical services.
+   As the protagonist of HackTheCloud25, MediCloudX represents the real
+   security challenges faced by modern organizations:
+
+   • 🔐 Identity and access management
+   • 💾 Protection of sensitive patient data
+   • 🌉 Multi-cloud hybrid architectures
+   • 📊 Compliance with healthcare regulations
+   • 🚨 Real-time incident response
+
+   Through MediCloudX challenges, participants experience real attack
+   vectors and learn to strengthen security posture in critical cloud
+   environments.
+
+🚩 **Hack The Cloud CTF 2025**
+   A cloud cybersecurity challenge at EkoParty 2025
+   • 👥 Teams of 3 members
+   • ☁️  15 challenges distributed across AWS, Azure and GCP (5 per provider)
+   • 🏅 Prizes and scholarships for participating teams
+   • 🎖️  Electronic badges and recognition
+
+   🔗 https://ctf.ekocloudsec.com/
+
+💼 **Sponsors - Cloud Security Village**
+
+{_SPONSORS_TEXT}
+
+{'='*80}
+ 🙏 **Acknowledgments**
+{'='*80}
+   Thanks to all sponsors, organizers and participants who made
+   possible this unique learning and professional growth experience
+   in cloud cybersecurity.
+
+   Framework developed by EkoCloudSec Community
+   🔗 https://github.com/Spartan-Cybersecurity/HackTheCloud25
+
+   See you in the next edition! 🚀
+
+{'='*80}
+"""
 
 
 class CTFManager:
     """Main CTF Manager class that orchestrates all operations"""
     
     def __init__(self):
+        import threading
+        
         self.base_path = Path(__file__).parent
         self.logger = setup_logger("ctf-manager", "INFO")
+        self._output_lock = threading.Lock()
+        self._warmup_thread: Optional[threading.Thread] = None
+    
+    @cached_property
+    def config_loader(self):
+        """Configuration loader, loading challenges.yaml on first use"""
+        from lib.config_loader import ConfigLoader
         
-        # Initialize components
-        self.config_loader = ConfigLoader(self.base_path / "config")
-        self.credential_manager = CredentialManager(self.config_loader)
-        self.terraform_manager = TerraformManager(self.credential_manager)
-        
-        # Load configuration
+        config_loader = ConfigLoader.instance(self.base_path / "config")
         try:
-            self.config_loader.load_challenges_config()
+            config_loader.load_challenges_config()
             self.logger.info("CTF Manager initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize CTF Manager: {e}")
             sys.exit(1)
+        return config_loader
+    
+    @cached_property
+    def credential_manager(self):
+        """Credential manager, created on first use"""
+        from lib.credential_manager import CredentialManager
+        return CredentialManager.instance(self.config_loader)
+    
+    @cached_property
+    def terraform_manager(self):
+        """Terraform manager, created on first use"""
+        from lib.terraform_manager import TerraformManager
+        return TerraformManager(self.credential_manager)
+    
+    def _start_provider_warmup(self, challenges: List[Challenge]) -> None:
+        """
+        Download providers in a background thread while the user works through prompts
+        
+        Runs at most once per CTFManager; later calls are no-ops.
+        """
+        import threading
+        
+        if self._warmup_thread is not None:
+            return
+        
+        # Share downloaded provider plugins between challenges (respect a user-provided
+        # cache); TerraformManager.init falls back to the same directory
+        plugin_cache_dir = self.base_path / ".terraform-plugin-cache"
+        plugin_cache_dir.mkdir(exist_ok=True)
+        os.environ.setdefault("TF_PLUGIN_CACHE_DIR", str(plugin_cache_dir))
+        
+        # Resolve lazy components here rather than from the warm-up thread
+        self.terraform_manager
+        self._warmup_thread = threading.Thread(
+            target=self._warm_providers, args=(challenges,),
+            name="provider-warmup", daemon=True
+        )
+        self._warmup_thread.start()
+    
+    def _warm_providers(self, challenges: List[Challenge]) -> None:
+        """
+        Pre-populate the provider plugin cache with every provider the batch uses
+        
+        Each challenge's .tf files are copied to a scratch directory and initialized
+        there with -backend=false, so providers land in TF_PLUGIN_CACHE_DIR without
+        touching the challenge's own working directory or remote state. Challenges
+        are initialized one after another, as the cache is not safe for concurrent
+        use; providers already cached are only linked.
+        """
+        import shutil
+        import subprocess
+        
+        warmup_root = Path(os.environ["TF_PLUGIN_CACHE_DIR"]) / ".warmup"
+        
+        for challenge in challenges:
+            if not challenge.full_directory_path:
+                continue
+            
+            scratch_dir = warmup_root / challenge.name
+            try:
+                scratch_dir.mkdir(parents=True, exist_ok=True)
+                for tf_file in challenge.full_directory_path.glob('*.tf'):
+                    shutil.copyfile(tf_file, scratch_dir / tf_file.name)
+                
+                result = subprocess.run(
+                    ['terraform', 'init', '-backend=false', '-input=false'],
+                    cwd=scratch_dir,
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    text=True,
+                    timeout=600
+                )
+                self.logger.debug(f"Provider warm-up for {challenge.name} finished "
+                                  f"with return code {result.returncode}")
+            except (OSError, subprocess.SubprocessError) as e:
+                self.logger.debug(f"Provider warm-up for {challenge.name} skipped: {e}")
+    
+    def _wait_for_provider_warmup(self) -> None:
+        """Block until provider warm-up is done so it never races a real 'terraform init'"""
+        if self._warmup_thread is not None:
+            self._warmup_thread.join()
+    
+    @cached_property
+    def _challenges(self) -> Dict[str, Challenge]:
+        """All configured challenges, built once and shared by every query"""
+        from lib.challenge import Challenge
+        
+        return {
+            name: Challenge(name, config, self.base_path)
+            for name, config in self.config_loader.get_all_challenges().items()
+        }
     
     def get_challenge(self, challenge_name: str) -> Optional[Challenge]:
         """Get a challenge by name"""
-        config = self.config_loader.get_challenge_config(challenge_name)
-        if not config:
-            return None
-        
-        return Challenge(challenge_name, config, self.base_path)
+        return self._challenges.get(challenge_name)
     
     def get_all_challenges(self) -> List[Challenge]:
         """Get all configured challenges"""
-        all_configs = self.config_loader.get_all_challenges()
-        return [
-            Challenge(name, config, self.base_path) 
-            for name, config in all_configs.items()
-        ]
+        return list(self._challenges.values())
     
     def get_challenges_by_provider(self, provider: str) -> List[Challenge]:
         """Get challenges filtered by provider"""
-        provider_configs = self.config_loader.get_challenges_by_provider(provider)
-        return [
-            Challenge(name, config, self.base_path)
-            for name, config in provider_configs.items()
-        ]
+        return [c for c in self._challenges.values() if c.provider == provider]
+    
+    def _get_status(self, challenge: Challenge) -> ChallengeStatus:
+        """Get challenge status (cached on the challenge while its state is unchanged)"""
+        return challenge.get_status_from_terraform_state()
+    
+    def _prefetch_all_statuses(self, challenges: Optional[List[Challenge]] = None) -> None:
+        """Populate the status cache for many challenges, probing them concurrently"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if challenges is None:
+            challenges = self.get_all_challenges()
+        
+        with ThreadPoolExecutor(max_workers=STATUS_PROBE_WORKERS) as executor:
+            list(executor.map(self._get_status, challenges))
+    
+    def _emit(self, *lines: str) -> None:
+        """Write progress lines as a single block so concurrent workers don't interleave"""
+        with self._output_lock:
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
+    
+    def _run_for_challenges(self, action, challenges: List[Challenge], verb: str,
+                            parallelism: int = 1, reverse_dependencies: bool = False,
+                            **kwargs) -> int:
+        """
+        Run a per-challenge action, fanning out across worker threads
+        
+        A challenge is only started once the challenges it depends on (within this
+        batch) have succeeded, and is skipped if any of them failed.
+        
+        Args:
+            action: Callable taking a challenge name (deploy_challenge/destroy_challenge)
+            challenges: Challenges to process
+            verb: Verb used in failure messages
+            parallelism: Maximum number of challenges processed concurrently
+            reverse_dependencies: Process dependents before their dependencies (for destroy)
+            
+        Returns:
+            Number of challenges processed successfully
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+        
+        def run(challenge: Challenge) -> bool:
+            self._emit(f"\n{'='*60}")
+            return action(challenge.name, **kwargs)
+        
+        # Challenges each one has to wait for, limited to this batch
+        names = {c.name for c in challenges}
+        if reverse_dependencies:
+            waits_on = {c.name: [d.name for d in challenges if c.name in d.dependencies]
+                        for c in challenges}
+        else:
+            waits_on = {c.name: [name for name in c.dependencies if name in names]
+                        for c in challenges}
+        
+        # Resolve lazy components up front rather than racing on them from workers
+        self._challenges
+        self.terraform_manager
+        
+        results: Dict[str, bool] = {}
+        pending = list(challenges)
+        running = {}
+        with ThreadPoolExecutor(max_workers=max(1, parallelism)) as executor:
+            while pending or running:
+                # Start everything that is unblocked; a skip can unblock (skip) more
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for challenge in list(pending):
+                        blockers = waits_on[challenge.name]
+                        failed = [name for name in blockers if results.get(name) is False]
+                        if failed:
+                            self.logger.error(f"Skipping {verb} of {challenge.name}: "
+                                              f"{', '.join(failed)} did not succeed")
+                            results[challenge.name] = False
+                        elif all(results.get(name) for name in blockers):
+                            running[executor.submit(run, challenge)] = challenge
+                        else:
+                            continue
+                        pending.remove(challenge)
+                        progressed = True
+                
+                if not running:
+                    # Whatever is left waits on itself
+                    for challenge in pending:
+                        self.logger.error(f"Cannot {verb} {challenge.name}: circular dependencies")
+                        results[challenge.name] = False
+                    break
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    challenge = running.pop(future)
+                    results[challenge.name] = bool(future.result())
+                    if not results[challenge.name]:
+                        self.logger.error(f"Failed to {verb} {challenge.name}")
+        
+        return sum(results.values())
     
     def list_challenges(self, provider: Optional[str] = None, 
                        difficulty: Optional[str] = None, 
-                       show_details: bool = False) -> None:
-        """List all challenges with optional filtering"""
+                       show_details: bool = False,
+                       with_status: bool = False) -> None:
+        """
+        List all challenges with optional filtering
+        
+        Args:
+            provider: Only list challenges for this cloud provider
+            difficulty: Only list challenges of this difficulty
+            show_details: Include directory, backend, tags and validation errors
+            with_status: Probe Terraform state to show each challenge's deployment status
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
         challenges = self.get_all_challenges()
         
         # Apply filters
@@ -87,35 +422,61 @@ class CTFManager:
             print("No challenges found matching the criteria")
             return
         
-        # Display challenges
-        print(f"\n{'='*80}")
-        print(f" HackTheCloud25 - Available Challenges ({len(challenges)} found)")
-        print(f"{'='*80}")
+        # Start validations in the background while rows are rendered
+        validations = {}
+        if show_details:
+            executor = ThreadPoolExecutor(max_workers=STATUS_PROBE_WORKERS)
+            validations = {c.name: executor.submit(c.validate) for c in challenges}
+            executor.shutdown(wait=False)
+        
+        if with_status:
+            self._prefetch_all_statuses(challenges)
+        
+        # Display challenges, writing one block per challenge
+        self._emit(
+            f"\n{'='*80}",
+            f" HackTheCloud25 - Available Challenges ({len(challenges)} found)",
+            f"{'='*80}"
+        )
         
         for challenge in challenges:
-            status = challenge.get_status_from_terraform_state()
-            status_color = self._get_status_color(status)
-            
-            print(f"\n📋 {challenge.name}")
-            print(f"   Provider: {challenge.provider.upper()}")
-            print(f"   Difficulty: {challenge.difficulty.capitalize()}")
-            print(f"   Status: {status_color}{status.value.upper()}\033[0m")
-            print(f"   Description: {challenge.description}")
+            lines = [
+                f"\n📋 {challenge.name}",
+                f"   Provider: {challenge.provider.upper()}",
+                f"   Difficulty: {challenge.difficulty.capitalize()}"
+            ]
+            if with_status:
+                lines.append(f"   Status: {_status_line(self._get_status(challenge))}")
+            lines.append(f"   Description: {challenge.description}")
             
             if show_details:
-                print(f"   Directory: {challenge.directory}")
-                print(f"   Backend Config: {challenge.backend_config}")
-                print(f"   Tags: {', '.join(challenge.tags)}")
+                lines.append(f"   Directory: {challenge.directory}")
+                lines.append(f"   Backend Config: {challenge.backend_config}")
+                lines.append(f"   Tags: {', '.join(challenge.tags)}")
                 
                 # Show validation
-                is_valid, errors = challenge.validate()
+                is_valid, errors = validations[challenge.name].result()
                 if not is_valid:
-                    print(f"   ⚠️  Validation Errors: {', '.join(errors)}")
+                    lines.append(f"   ⚠️  Validation Errors: {', '.join(errors)}")
+            
+            self._emit(*lines)
         
-        print(f"\n{'='*80}")
+        self._emit(f"\n{'='*80}")
     
-    def deploy_challenge(self, challenge_name: str, auto_approve: bool = False) -> bool:
-        """Deploy a specific challenge"""
+    def deploy_challenge(self, challenge_name: str, auto_approve: bool = False,
+                         tf_parallelism: Optional[int] = None,
+                         prep_plan: Optional[Dict[str, List[str]]] = None) -> bool:
+        """
+        Deploy a specific challenge
+        
+        Args:
+            challenge_name: Name of the challenge to deploy
+            auto_approve: Skip confirmation prompts
+            tf_parallelism: Concurrent resource operations per Terraform run
+            prep_plan: Pre-approved preparation scripts per challenge (skips prompts)
+        """
+        from lib.challenge import Challenge
+        
         challenge = self.get_challenge(challenge_name)
         if not challenge:
             self.logger.error(f"Challenge not found: {challenge_name}")
@@ -137,38 +498,48 @@ class CTFManager:
                 self.logger.error(f"Missing credentials: {', '.join(env_validation['missing_credentials'])}")
             return False
         
-        print(f"\n🚀 Deploying challenge: {challenge.name}")
-        print(f"   Provider: {challenge.provider.upper()}")
-        print(f"   Directory: {challenge.directory}")
+        self._emit(
+            f"\n🚀 Deploying challenge: {challenge.name}",
+            f"   Provider: {challenge.provider.upper()}",
+            f"   Directory: {challenge.directory}"
+        )
         
         # Initialize Terraform
-        print("\n📦 Initializing Terraform...")
+        self._emit(f"\n📦 Initializing Terraform ({challenge.name})...")
+        self._wait_for_provider_warmup()
         if not self.terraform_manager.init(challenge):
             self.logger.error("Terraform initialization failed")
             return False
         
         # Handle preparation scripts
-        if not self._handle_preparation_scripts(challenge):
+        approved_scripts = prep_plan.get(challenge.name, []) if prep_plan is not None else None
+        if not self._handle_preparation_scripts(challenge, auto_approve, approved_scripts):
             self.logger.error("Preparation script execution failed")
             return False
         
         # Apply configuration
-        print("\n🔨 Applying Terraform configuration...")
-        if not self.terraform_manager.apply(challenge, auto_approve=auto_approve):
+        self._emit(f"\n🔨 Applying Terraform configuration ({challenge.name})...")
+        if not self.terraform_manager.apply(challenge, auto_approve=auto_approve,
+                                            parallelism=tf_parallelism):
             self.logger.error("Terraform apply failed")
             return False
         
         # Get outputs
-        print("\n📄 Getting deployment outputs...")
+        self._emit(f"\n📄 Getting deployment outputs ({challenge.name})...")
         success, outputs = self.terraform_manager.get_outputs(challenge)
         if success and outputs:
-            print("\n✅ Deployment successful! Outputs:")
-            self._display_outputs(outputs)
+            with self._output_lock:
+                print(f"\n✅ Deployment of '{challenge.name}' successful! Outputs:")
+                self._display_outputs(outputs)
         
-        print(f"\n🎉 Challenge '{challenge.name}' deployed successfully!")
+        challenge.invalidate_status()
+        Challenge.invalidate_outputs_cache(challenge.name)
+        self._emit(f"\n🎉 Challenge '{challenge.name}' deployed successfully!")
         return True
     
-    def deploy_provider_challenges(self, provider: str, auto_approve: bool = False) -> bool:
+    def deploy_provider_challenges(self, provider: str, auto_approve: bool = False,
+                                   parallelism: int = 1,
+                                   tf_parallelism: Optional[int] = None) -> bool:
         """Deploy all challenges for a specific provider"""
         challenges = self.get_challenges_by_provider(provider)
         
@@ -176,50 +547,94 @@ class CTFManager:
             self.logger.error(f"No challenges found for provider: {provider}")
             return False
         
+        if parallelism > 1 and not auto_approve:
+            # Interactive Terraform prompts cannot be shared between concurrent deployments
+            self.logger.warning("Parallel deployment requires --auto-approve, deploying sequentially")
+            parallelism = 1
+        
         print(f"\n🚀 Deploying all {provider.upper()} challenges ({len(challenges)} found)")
         
-        success_count = 0
-        for challenge in challenges:
-            print(f"\n{'='*60}")
-            if self.deploy_challenge(challenge.name, auto_approve):
-                success_count += 1
-            else:
-                self.logger.error(f"Failed to deploy {challenge.name}")
+        try:
+            # Download providers and initialize working directories in the background
+            # while prompts are answered (deploy_challenge reports anything invalid)
+            if self.credential_manager.validate_environment(provider)['environment_ready']:
+                valid = [c for c in challenges if c.validate()[0]]
+                if valid:
+                    self._start_provider_warmup(valid)
+                for challenge in valid:
+                    self.terraform_manager.prewarm(challenge, wait_for=self._wait_for_provider_warmup)
+            
+            # Settle every preparation prompt before dispatching the deployments
+            prep_plan = self._plan_preparation(challenges, auto_approve)
+            
+            success_count = self._run_for_challenges(
+                self.deploy_challenge, challenges, "deploy",
+                parallelism=parallelism, auto_approve=auto_approve,
+                tf_parallelism=tf_parallelism, prep_plan=prep_plan
+            )
+        finally:
+            # Don't leave queued inits running against the backends (e.g. after Ctrl-C)
+            self.terraform_manager.cancel_prewarm()
         
         print(f"\n{'='*60}")
         print(f"✅ Deployed {success_count}/{len(challenges)} challenges successfully")
         return success_count == len(challenges)
     
-    def destroy_challenge(self, challenge_name: str, auto_approve: bool = False) -> bool:
+    def destroy_challenge(self, challenge_name: str, auto_approve: bool = False,
+                          tf_parallelism: Optional[int] = None) -> bool:
         """Destroy a specific challenge"""
+        from lib.challenge import Challenge, ChallengeStatus
+        
         challenge = self.get_challenge(challenge_name)
         if not challenge:
             self.logger.error(f"Challenge not found: {challenge_name}")
             return False
         
-        status = challenge.get_status_from_terraform_state()
+        status = self._get_status(challenge)
         if status == ChallengeStatus.NOT_DEPLOYED:
-            print(f"Challenge '{challenge.name}' is not deployed")
+            self._emit(f"Challenge '{challenge.name}' is not deployed")
             return True
         
-        print(f"\n💥 Destroying challenge: {challenge.name}")
-        print(f"   Provider: {challenge.provider.upper()}")
+        self._emit(
+            f"\n💥 Destroying challenge: {challenge.name}",
+            f"   Provider: {challenge.provider.upper()}"
+        )
         
         # Destroy resources
-        if not self.terraform_manager.destroy(challenge, auto_approve=auto_approve):
+        if not self.terraform_manager.destroy(challenge, auto_approve=auto_approve,
+                                              parallelism=tf_parallelism):
             self.logger.error("Terraform destroy failed")
             return False
         
-        print(f"\n🗑️  Challenge '{challenge.name}' destroyed successfully!")
+        challenge.invalidate_status()
+        Challenge.invalidate_outputs_cache(challenge.name)
+        self._emit(f"\n🗑️  Challenge '{challenge.name}' destroyed successfully!")
         return True
     
-    def destroy_all_challenges(self, auto_approve: bool = False) -> bool:
+    def destroy_all_challenges(self, auto_approve: bool = False, parallelism: int = 1,
+                               tf_parallelism: Optional[int] = None) -> bool:
         """Destroy all deployed challenges"""
+        from concurrent.futures import ThreadPoolExecutor
+        from lib.challenge import ChallengeStatus
+        
         challenges = self.get_all_challenges()
-        deployed_challenges = [
-            c for c in challenges 
-            if c.get_status_from_terraform_state() == ChallengeStatus.DEPLOYED
-        ]
+        
+        # Probe state in the background so its cost hides behind the confirmation prompt
+        executor = ThreadPoolExecutor(max_workers=STATUS_PROBE_WORKERS)
+        probes = [executor.submit(self._get_status, c) for c in challenges]
+        try:
+            if not auto_approve:
+                response = input("\n⚠️  This will destroy ALL deployed challenges. Continue? (yes/no): ")
+                if response.lower() != 'yes':
+                    print("Operation cancelled")
+                    return False
+            
+            deployed_challenges = [
+                c for c, probe in zip(challenges, probes)
+                if probe.result() == ChallengeStatus.DEPLOYED
+            ]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         
         if not deployed_challenges:
             print("No deployed challenges found")
@@ -227,19 +642,11 @@ class CTFManager:
         
         print(f"\n💥 Destroying all challenges ({len(deployed_challenges)} deployed)")
         
-        if not auto_approve:
-            response = input("\n⚠️  This will destroy ALL deployed challenges. Continue? (yes/no): ")
-            if response.lower() != 'yes':
-                print("Operation cancelled")
-                return False
-        
-        success_count = 0
-        for challenge in deployed_challenges:
-            print(f"\n{'='*60}")
-            if self.destroy_challenge(challenge.name, auto_approve=True):
-                success_count += 1
-            else:
-                self.logger.error(f"Failed to destroy {challenge.name}")
+        success_count = self._run_for_challenges(
+            self.destroy_challenge, deployed_challenges, "destroy",
+            parallelism=parallelism, reverse_dependencies=True, auto_approve=True,
+            tf_parallelism=tf_parallelism
+        )
         
         print(f"\n{'='*60}")
         print(f"🗑️  Destroyed {success_count}/{len(deployed_challenges)} challenges")
@@ -247,6 +654,8 @@ class CTFManager:
     
     def show_status(self, challenge_name: Optional[str] = None) -> None:
         """Show status of challenges"""
+        from lib.challenge import ChallengeStatus
+        
         if challenge_name:
             challenges = [self.get_challenge(challenge_name)]
             if not challenges[0]:
@@ -254,46 +663,50 @@ class CTFManager:
                 return
         else:
             challenges = self.get_all_challenges()
+            self._prefetch_all_statuses(challenges)
         
-        print(f"\n{'='*80}")
-        print(f" HackTheCloud25 - Challenge Status")
-        print(f"{'='*80}")
-        
-        status_counts = {}
+        self._emit(
+            f"\n{'='*80}",
+            f" HackTheCloud25 - Challenge Status",
+            f"{'='*80}"
+        )
         
         for challenge in challenges:
-            status = challenge.get_status_from_terraform_state()
-            status_color = self._get_status_color(status)
+            status = self._get_status(challenge)
             
-            print(f"\n📋 {challenge.name}")
-            print(f"   Provider: {challenge.provider.upper()}")
-            print(f"   Status: {status_color}{status.value.upper()}\033[0m")
+            lines = [
+                f"\n📋 {challenge.name}",
+                f"   Provider: {challenge.provider.upper()}",
+                f"   Status: {_status_line(status)}"
+            ]
             
             # Get validation info
             validation = self.terraform_manager.validate_challenge_deployment(challenge)
             
             if status == ChallengeStatus.DEPLOYED:
-                print(f"   Resources: {validation.get('resource_count', 0)}")
-                print(f"   Outputs Available: {'✅' if validation.get('outputs_available') else '❌'}")
+                lines.append(f"   Resources: {validation.get('resource_count', 0)}")
+                lines.append(f"   Outputs Available: {'✅' if validation.get('outputs_available') else '❌'}")
             
-            # Count statuses
-            status_counts[status.value] = status_counts.get(status.value, 0) + 1
+            self._emit(*lines)
         
-        # Summary
-        print(f"\n{'='*80}")
-        print("📊 Summary:")
+        # Summary (statuses are served from the cache filled above)
+        status_counts = Counter(self._get_status(c).value for c in challenges)
+        lines = [f"\n{'='*80}", "📊 Summary:"]
         for status, count in status_counts.items():
-            print(f"   {status.upper()}: {count}")
-        print(f"{'='*80}")
+            lines.append(f"   {status.upper()}: {count}")
+        lines.append(f"{'='*80}")
+        self._emit(*lines)
     
     def get_outputs(self, challenge_name: str, output_format: str = "table") -> None:
         """Get outputs from a deployed challenge"""
+        from lib.challenge import ChallengeStatus
+        
         challenge = self.get_challenge(challenge_name)
         if not challenge:
             self.logger.error(f"Challenge not found: {challenge_name}")
             return
         
-        status = challenge.get_status_from_terraform_state()
+        status = self._get_status(challenge)
         if status != ChallengeStatus.DEPLOYED:
             self.logger.error(f"Challenge '{challenge_name}' is not deployed")
             return
@@ -312,7 +725,10 @@ class CTFManager:
         print(f"{'='*60}")
         
         if output_format == "json":
-            print(json.dumps(outputs, indent=2))
+            # Flush pending text first, then write the encoded bytes straight to the buffer
+            sys.stdout.flush()
+            sys.stdout.buffer.write(_dump_json(outputs) + b"\n")
+            sys.stdout.buffer.flush()
         else:
             self._display_outputs(outputs)
     
@@ -326,75 +742,77 @@ class CTFManager:
             else:
                 print(f"🔑 {key}: {value}")
     
-    def _get_status_color(self, status) -> str:
-        """Get color code for challenge status"""
-        # Avoid import issues by using string values directly
-        if hasattr(status, 'value'):
-            status_value = status.value
-        else:
-            status_value = str(status)
-            
-        colors = {
-            "deployed": "\033[32m",  # Green
-            "not_deployed": "\033[31m",  # Red
-            "unknown": "\033[33m"  # Yellow
-        }
-        return colors.get(status_value, "\033[37m")
-    
     def _detect_preparation_scripts(self, challenge) -> list:
         """Detect preparation scripts in challenge directory"""
         if not challenge.full_directory_path:
             return []
-            
-        common_prep_scripts = [
-            "install_dependencies.sh",
-            "setup.sh", 
-            "prepare.sh",
-            "build.sh"
-        ]
         
-        detected_scripts = []
-        for script in common_prep_scripts:
-            script_path = challenge.full_directory_path / script
-            if script_path.exists() and script_path.is_file():
-                detected_scripts.append(script)
+        # One directory read instead of a stat per candidate script
+        try:
+            with os.scandir(challenge.full_directory_path) as entries:
+                found = {
+                    entry.name for entry in entries
+                    if entry.name in _PREP_SCRIPTS and entry.is_file(follow_symlinks=False)
+                }
+        except FileNotFoundError:
+            return []
         
-        return detected_scripts
+        return [script for script in _PREP_SCRIPTS if script in found]
     
     def _execute_preparation_script(self, challenge, script_name: str) -> bool:
         """Execute preparation script in challenge directory"""
+        import signal
+        import subprocess
+        import threading
+        
         try:
-            import subprocess
-            import os
-            
             script_path = challenge.full_directory_path / script_name
             
             # Make script executable
             os.chmod(script_path, 0o755)
             
-            # Execute script
+            # Execute script, streaming its output as it is produced
             self.logger.info(f"Executing preparation script: {script_name}")
-            result = subprocess.run(
+            process = subprocess.Popen(
                 ["bash", str(script_path)],
                 cwd=challenge.full_directory_path,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300  # 5 minute timeout
+                bufsize=1,
+                start_new_session=True
             )
             
-            if result.returncode == 0:
+            # Enforce the timeout while output is still streaming; kill the whole
+            # process group so child processes don't keep the pipe open
+            timed_out = threading.Event()
+            
+            def kill_script():
+                timed_out.set()
+                os.killpg(process.pid, signal.SIGKILL)
+            
+            watchdog = threading.Timer(PREP_SCRIPT_TIMEOUT, kill_script)
+            watchdog.start()
+            try:
+                for line in process.stdout:
+                    sys.stdout.write(line)
+                returncode = process.wait()
+            finally:
+                watchdog.cancel()
+                process.stdout.close()
+            
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(process.args, PREP_SCRIPT_TIMEOUT)
+            
+            if returncode == 0:
                 self.logger.info(f"Preparation script {script_name} executed successfully")
-                if result.stdout:
-                    print(result.stdout)
                 return True
             else:
-                self.logger.error(f"Preparation script {script_name} failed with return code {result.returncode}")
-                if result.stderr:
-                    self.logger.error(f"Error output: {result.stderr}")
+                self.logger.error(f"Preparation script {script_name} failed with return code {returncode}")
                 return False
                 
         except subprocess.TimeoutExpired:
-            self.logger.error(f"Preparation script {script_name} timed out after 5 minutes")
+            self.logger.error(f"Preparation script {script_name} timed out after {PREP_SCRIPT_TIMEOUT // 60} minutes")
             return False
         except Exception as e:
             self.logger.error(f"Error executing preparation script {script_name}: {e}")
@@ -421,15 +839,61 @@ class CTFManager:
         
         return response in ['', 'y', 'yes']
     
-    def _handle_preparation_scripts(self, challenge) -> bool:
-        """Handle detection and execution of preparation scripts"""
+    def _plan_preparation(self, challenges: List[Challenge],
+                          auto_approve: bool = False) -> Dict[str, List[str]]:
+        """
+        Decide up front which preparation scripts to run for a batch of challenges
+        
+        Asks once for the whole batch so deployments never wait on input() mid-run.
+        
+        Returns:
+            Mapping of challenge name to the preparation scripts approved for it
+        """
+        detected = {}
+        for challenge in challenges:
+            scripts = self._detect_preparation_scripts(challenge)
+            if scripts:
+                detected[challenge.name] = scripts
+        
+        if not detected or auto_approve:
+            return detected
+        
+        script_count = sum(len(scripts) for scripts in detected.values())
+        print(f"\n⚠️  **PREPARATION REQUIRED**")
+        for name, scripts in detected.items():
+            print(f"   {name}: {', '.join(scripts)}")
+        print(f"   ")
+        response = input(f"❓ Execute {script_count} preparation script(s) across {len(detected)} "
+                         f"challenge(s) before deployment? [Y/n]: ").strip().lower()
+        
+        if response in ['', 'y', 'yes']:
+            return detected
+        
+        return {}
+    
+    def _handle_preparation_scripts(self, challenge, auto_approve: bool = False,
+                                    approved_scripts: Optional[List[str]] = None) -> bool:
+        """
+        Handle detection and execution of preparation scripts
+        
+        Args:
+            challenge: Challenge instance
+            auto_approve: Run detected scripts without prompting
+            approved_scripts: Scripts already approved by _plan_preparation (skips prompts)
+        """
         detected_scripts = self._detect_preparation_scripts(challenge)
         
         if not detected_scripts:
             return True  # No preparation needed
         
         for script in detected_scripts:
-            if self._confirm_preparation_script(script):
+            if approved_scripts is not None:
+                run_script = script in approved_scripts
+            else:
+                # Auto-approve runs scripts without prompting so worker threads never block on input()
+                run_script = auto_approve or self._confirm_preparation_script(script)
+            
+            if run_script:
                 print(f"\n🔧 Executing preparation script: {script}")
                 if not self._execute_preparation_script(challenge, script):
                     self.logger.error(f"Preparation script {script} failed")
@@ -443,117 +907,75 @@ class CTFManager:
 
     def show_credits(self) -> None:
         """Show credits information about Cloud Security Space and sponsors"""
-        print(f"\n{'='*80}")
-        print(f" 🏆 HackTheCloud25 - Credits & Acknowledgments")
-        print(f"{'='*80}")
-        
-        # Cloud Security Space Info
-        print(f"\n🌐 **Cloud Security Space - EkoParty 2025**")
-        print(f"   📅 October 22-24, 2025")
-        print(f"   📍 CEC - Buenos Aires, Argentina")
-        print(f"   🎯 Explore, Learn and Master Cloud Security")
-        print(f"")
-        print(f"   A comprehensive cybersecurity experience focused on cloud environments where")
-        print(f"   professionals and enthusiasts immerse themselves in real attack and defense")
-        print(f"   scenarios across AWS, Azure and GCP. The Cloud Security Village at EkoParty")
-        print(f"   2025 offers hands-on labs, specialized conferences and a comprehensive CTF")
-        print(f"   challenge focused on cloud security.")
-        print(f"")
-        print(f"   🔗 https://cloudsecurityspace.org/")
-        
-        # MediCloudX Info
-        print(f"\n🏥 **MediCloudX - The Fictional Company**")
-        print(f"   An innovative digital health platform that migrated its critical")
-        print(f"   infrastructure to the cloud to provide cutting-edge medical services.")
-        print(f"   As the protagonist of HackTheCloud25, MediCloudX represents the real")
-        print(f"   security challenges faced by modern organizations:")
-        print(f"")
-        print(f"   • 🔐 Identity and access management")
-        print(f"   • 💾 Protection of sensitive patient data")
-        print(f"   • 🌉 Multi-cloud hybrid architectures") 
-        print(f"   • 📊 Compliance with healthcare regulations")
-        print(f"   • 🚨 Real-time incident response")
-        print(f"")
-        print(f"   Through MediCloudX challenges, participants experience real attack")
-        print(f"   vectors and learn to strengthen security posture in critical cloud")
-        print(f"   environments.")
-        
-        # Hack The Cloud CTF Info
-        print(f"\n🚩 **Hack The Cloud CTF 2025**")
-        print(f"   A cloud cybersecurity challenge at EkoParty 2025")
-        print(f"   • 👥 Teams of 3 members")
-        print(f"   • ☁️  15 challenges distributed across AWS, Azure and GCP (5 per provider)")
-        print(f"   • 🏅 Prizes and scholarships for participating teams")
-        print(f"   • 🎖️  Electronic badges and recognition")
-        print(f"")
-        print(f"   🔗 https://ctf.ekocloudsec.com/")
-        
-        # Sponsors
-        print(f"\n💼 **Sponsors - Cloud Security Village**")
-        print(f"")
-        
-        # Village Core Sponsor
-        print(f"   🌟 **Village Core Sponsor**")
-        print(f"   • InterBank (Peru)")
-        print(f"")
-        
-        # Village Guardian
-        print(f"   🛡️  **Village Guardian**")
-        print(f"   • Orca Security (USA)")
-        print(f"")
-        
-        # Village Partners
-        print(f"   🤝 **Village Partners**")
-        sponsors_partner = [
-            ("OZ Digital Consulting", "USA"),
-            ("Semilla Cyber", "Puerto Rico"), 
-            ("Offensive Security", "USA"),
-            ("Altered Security", "India"),
-            ("Spartan-Cybersecurity", "Colombia"),
-            ("Electronic Cats", "Mexico"),
-            ("CyberWarFare Labs", "India"),
-            ("GISAC", "Colombia"),
-            ("UqBar", "Colombia")
-        ]
-        for name, country in sponsors_partner:
-            print(f"   • {name} ({country})")
-        print(f"")
-        
-        # Village Builders  
-        print(f"   🏗️  **Village Builders**")
-        sponsors_builder = [
-            ("PlainText", "Dominican Republic"),
-            ("RedTeamRD", "Dominican Republic"),
-            ("AWS Security Latam", "Mexico")
-        ]
-        for name, country in sponsors_builder:
-            print(f"   • {name} ({country})")
-        print(f"")
-        
-        # Village Allies
-        print(f"   🤝 **Village Allies**") 
-        sponsors_ally = [
-            ("ASC IT GROUP", "Colombia"),
-            ("NicaSecurity", "Nicaragua"),
-            ("nuvem", "Peru")
-        ]
-        for name, country in sponsors_ally:
-            print(f"   • {name} ({country})")
-        
-        print(f"\n{'='*80}")
-        print(f" 🙏 **Acknowledgments**")
-        print(f"{'='*80}")
-        print(f"   Thanks to all sponsors, organizers and participants who made")
-        print(f"   possible this unique learning and professional growth experience")
-        print(f"   in cloud cybersecurity.")
-        print(f"")
-        print(f"   Framework developed by EkoCloudSec Community")
-        print(f"   🔗 https://github.com/Spartan-Cybersecurity/HackTheCloud25")
-        print(f"")
-        print(f"   See you in the next edition! 🚀")
-        print(f"\n{'='*80}")
+        sys.stdout.write(_CREDITS_TEXT)
+        sys.stdout.flush()
 
 
+def _cache_dir() -> Path:
+    """Get the per-user cache directory for CTF Manager"""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ctf-manager"
+
+
+def _challenge_names() -> List[str]:
+    """
+    Get configured challenge names for shell completion
+    
+    Names are cached on disk and reused until ctf-manager.py or
+    challenges.yaml changes, so completing a word doesn't parse YAML.
+    """
+    base_path = Path(__file__).parent
+    config_path = base_path / "config" / "challenges.yaml"
+    try:
+        key = [Path(__file__).stat().st_mtime_ns, config_path.stat().st_mtime_ns]
+    except OSError:
+        return []
+    
+    cache_file = _cache_dir() / "choices.json"
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('key') == key:
+            return cached['challenges']
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    from lib.config_loader import ConfigLoader
+    names = sorted(ConfigLoader(base_path / "config").get_all_challenges())
+    
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'challenges': names}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    
+    return names
+
+
+def _completion_choices(words: List[str]) -> List[str]:
+    """Get completion candidates for the words typed so far (after the program name)"""
+    if not words:
+        return list(_COMMANDS)
+    if words[0] in _CHALLENGE_COMMANDS and len(words) == 1:
+        return _challenge_names()
+    return []
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1 (reported as a usage error)"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser for CLI"""
     parser = argparse.ArgumentParser(
@@ -583,6 +1005,10 @@ Examples:
                            help='Filter by difficulty level')
     list_parser.add_argument('--details', action='store_true',
                            help='Show detailed information')
+    list_parser.add_argument('--with-status', dest='with_status', action='store_true',
+                           help='Show deployment status (probes Terraform state)')
+    list_parser.add_argument('--no-status', dest='with_status', action='store_false',
+                           help='Skip deployment status (default)')
     
     # Deploy command
     deploy_parser = subparsers.add_parser('deploy', help='Deploy challenges')
@@ -592,6 +1018,11 @@ Examples:
                             help='Deploy all challenges for provider')
     deploy_parser.add_argument('--auto-approve', action='store_true',
                              help='Skip confirmation prompts')
+    deploy_parser.add_argument('--parallelism', type=_positive_int, default=1, metavar='N',
+                             help='Number of challenges to deploy concurrently (requires --auto-approve)')
+    deploy_parser.add_argument('--tf-parallelism', type=_positive_int, default=None, metavar='N',
+                             help='Concurrent resource operations per Terraform run '
+                             '(default: 3x CPU cores, min 10, capped per provider)')
     
     # Destroy command
     destroy_parser = subparsers.add_parser('destroy', help='Destroy challenges')
@@ -601,6 +1032,11 @@ Examples:
                              help='Destroy all deployed challenges')
     destroy_parser.add_argument('--auto-approve', action='store_true',
                                help='Skip confirmation prompts')
+    destroy_parser.add_argument('--parallelism', type=_positive_int, default=1, metavar='N',
+                               help='Number of challenges to destroy concurrently')
+    destroy_parser.add_argument('--tf-parallelism', type=_positive_int, default=None, metavar='N',
+                               help='Concurrent resource operations per Terraform run '
+                               '(default: 3x CPU cores, min 10, capped per provider)')
     
     # Status command
     status_parser = subparsers.add_parser('status', help='Show challenge status')
@@ -621,6 +1057,11 @@ Examples:
 
 def main():
     """Main entry point"""
+    # Shell-completion fast path: answer without building the parser or the manager
+    if len(sys.argv) > 1 and sys.argv[1] == '--_choices':
+        print('\n'.join(_completion_choices(sys.argv[2:])))
+        return 0
+    
     parser = create_parser()
     args = parser.parse_args()
     
@@ -635,31 +1076,38 @@ def main():
             ctf_manager.list_challenges(
                 provider=args.provider,
                 difficulty=args.difficulty,
-                show_details=args.details
+                show_details=args.details,
+                with_status=args.with_status
             )
         
         elif args.command == 'deploy':
             if args.provider:
                 success = ctf_manager.deploy_provider_challenges(
                     args.provider, 
-                    auto_approve=args.auto_approve
+                    auto_approve=args.auto_approve,
+                    parallelism=args.parallelism,
+                    tf_parallelism=args.tf_parallelism
                 )
             else:
                 success = ctf_manager.deploy_challenge(
                     args.challenge_name,
-                    auto_approve=args.auto_approve
+                    auto_approve=args.auto_approve,
+                    tf_parallelism=args.tf_parallelism
                 )
             return 0 if success else 1
         
         elif args.command == 'destroy':
             if args.all:
                 success = ctf_manager.destroy_all_challenges(
-                    auto_approve=args.auto_approve
+                    auto_approve=args.auto_approve,
+                    parallelism=args.parallelism,
+                    tf_parallelism=args.tf_parallelism
                 )
             else:
                 success = ctf_manager.destroy_challenge(
                     args.challenge_name,
-                    auto_approve=args.auto_approve
+                    auto_approve=args.auto_approve,
+                    tf_parallelism=args.tf_parallelism
                 )
             return 0 if success else 1
         
@@ -8,16 +8,29 @@ across AWS, Azure, and GCP platforms.
 __version__ = "1.0.0"
 __author__ = "EkoCloudSec"
 
-from .terraform_manager import TerraformManager
-from .config_loader import ConfigLoader
-from .credential_manager import CredentialManager
-from .challenge import Challenge
-from .logger import get_logger
-
-__all__ = [
-    'TerraformManager',
-    'ConfigLoader', 
-    'CredentialManager',
-    'Challenge',
-    'get_logger'
-]
+import importlib
+
+# Public names and the submodules that define them; imported on first access (PEP 562)
+_LAZY_EXPORTS = {
+    'TerraformManager': '.terraform_manager',
+    'ConfigLoader': '.config_loader',
+    'CredentialManager': '.credential_manager',
+    'Challenge': '.challenge',
+    'get_logger': '.logger'
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,12 +3,98 @@ Challenge class for managing individual CTF challenges
 """
 
 import os
+import re
+import json
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
 from .logger import get_logger
 
 
+# ${VAR_NAME} / ${challenge-name.output-name} references in variable values
+_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# File suffixes returned by Challenge.get_terraform_files
+_TERRAFORM_SUFFIXES = ('.tf', '.tfvars', '.tf.json')
+
+# Seconds a status probed from a remote backend is reused; local state is tracked by mtime
+STATUS_CACHE_TTL = 30
+
+# Parsed state files by path, reused while their (mtime, size) is unchanged
+_STATE_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+_STATE_CACHE_LOCK = threading.Lock()
+
+
+def load_state(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a Terraform state file, reusing the parsed copy while the file is unchanged
+    
+    Args:
+        path: Path to a terraform.tfstate file
+        
+    Returns:
+        Parsed state dictionary, or None if the file does not exist
+        
+    Raises:
+        OSError, ValueError: If the file cannot be read or is not valid JSON
+    """
+    key = str(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        return None
+    
+    with _STATE_CACHE_LOCK:
+        cached = _STATE_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    with open(key, 'rb') as f:
+        state = json.loads(f.read())
+    
+    with _STATE_CACHE_LOCK:
+        _STATE_CACHE[key] = (st.st_mtime_ns, st.st_size, state)
+    return state
+
+
+def _format_tfvars_string(key: str, value: Any) -> str:
+    """Format a terraform.tfvars line with a quoted value"""
+    return f'{key} = "{value}"'
+
+
+# terraform.tfvars line formatters by exact value type; anything else is quoted
+_TFVARS_FORMATTERS = {
+    str: _format_tfvars_string,
+    bool: lambda key, value: f'{key} = {str(value).lower()}',
+    int: lambda key, value: f'{key} = {value}',
+    float: lambda key, value: f'{key} = {value}'
+}
+
+
+# Manager classes, imported on first use (these modules import this one)
+_MANAGERS = None
+
+
+def _get_managers():
+    """
+    Get the ConfigLoader, CredentialManager and TerraformManager classes
+    
+    Returns:
+        Tuple of (ConfigLoader, CredentialManager, TerraformManager)
+    """
+    global _MANAGERS
+    if _MANAGERS is None:
+        from .config_loader import ConfigLoader
+        from .credential_manager import CredentialManager
+        from .terraform_manager import TerraformManager
+        _MANAGERS = (ConfigLoader, CredentialManager, TerraformManager)
+    return _MANAGERS
+
+
 class ChallengeStatus(Enum):
     """Challenge deployment status"""
     NOT_DEPLOYED = "not_deployed"
@@ -22,6 +108,36 @@ class ChallengeStatus(Enum):
 class Challenge:
     """Represents a single CTF challenge with its configuration and state"""
     
+    __slots__ = (
+        'name', 'config', 'base_path', 'logger',
+        'provider', 'difficulty', 'description', 'directory', 'backend_config',
+        'web_content', 'variables', 'outputs', 'tags', 'dependencies',
+        'full_directory_path', 'full_backend_config_path', 'full_web_content_path',
+        'tfvars_path', 'terraform_dir', 'lock_file', 'state_file', 'backup_file',
+        '_listing_cache', '_status_cache', '_status_cache_mtime', '_status_cache_time',
+        '_tfvars_written'
+    )
+    
+    VALID_PROVIDERS = frozenset(('aws', 'azure', 'gcp'))
+    
+    # Outputs of dependency challenges by name, shared by all instances
+    _dep_outputs_cache: Dict[str, Dict[str, Any]] = {}
+    _dep_fetch_locks: Dict[str, threading.Lock] = {}
+    _dep_outputs_lock = threading.Lock()
+    
+    # Common variable names mapped to provider credential keys
+    _VAR_MAPPING = {
+        'AZURE_SUBSCRIPTION_ID': 'subscription_id',
+        'AZURE_TENANT_ID': 'tenant_id',
+        'AZURE_CLIENT_ID': 'client_id',
+        'AZURE_CLIENT_SECRET': 'client_secret',
+        'AWS_ACCESS_KEY_ID': 'access_key_id',
+        'AWS_SECRET_ACCESS_KEY': 'secret_access_key',
+        'GCP_PROJECT_ID': 'project_id',
+        'GCP_REGION': 'region',
+        'GCP_USER_EMAIL': 'user_email'
+    }
+    
     def __init__(self, name: str, config: Dict[str, Any], base_path: Path = None):
         self.name = name
         self.config = config
@@ -38,11 +154,31 @@ class Challenge:
         self.variables = config.get('variables', {})
         self.outputs = config.get('outputs', [])
         self.tags = config.get('tags', [])
+        self.dependencies = config.get('dependencies') or []
         
         # Computed properties
         self.full_directory_path = self.base_path / self.directory if self.directory else None
         self.full_backend_config_path = self.base_path / self.backend_config if self.backend_config else None
         self.full_web_content_path = self.base_path / self.web_content if self.web_content else None
+        
+        # Well-known files in the challenge directory, None without a directory
+        directory_path = self.full_directory_path
+        self.tfvars_path = directory_path / 'terraform.tfvars' if directory_path else None
+        self.terraform_dir = directory_path / '.terraform' if directory_path else None
+        self.lock_file = directory_path / '.terraform.lock.hcl' if directory_path else None
+        self.state_file = directory_path / 'terraform.tfstate' if directory_path else None
+        self.backup_file = directory_path / 'terraform.tfstate.backup' if directory_path else None
+        
+        # Directory listings as (mtime_ns, [(name, is_file), ...]) by path
+        self._listing_cache: Dict[Path, Tuple[int, List[Tuple[str, bool]]]] = {}
+        
+        # Last probed status and the state fingerprint/time it was probed at
+        self._status_cache: Optional[ChallengeStatus] = None
+        self._status_cache_mtime: Optional[Tuple[str, int]] = None
+        self._status_cache_time = 0.0
+        
+        # Content and mtime_ns of the terraform.tfvars this instance last wrote
+        self._tfvars_written: Optional[Tuple[str, int]] = None
     
     def validate(self) -> tuple[bool, List[str]]:
         """
@@ -59,31 +195,78 @@ class Challenge:
         
         if not self.provider:
             errors.append("Provider is required")
-        elif self.provider not in ['aws', 'azure', 'gcp']:
+        elif self.provider not in self.VALID_PROVIDERS:
             errors.append(f"Invalid provider: {self.provider}")
         
+        # One scan of the challenge directory answers both directory checks
+        probe = self._probe_dir()
+        
         if not self.directory:
             errors.append("Directory is required")
-        elif self.full_directory_path and not self.full_directory_path.exists():
+        elif self.full_directory_path and not probe['exists']:
             errors.append(f"Challenge directory not found: {self.full_directory_path}")
         
         if not self.backend_config:
             errors.append("Backend config is required")
-        elif self.full_backend_config_path and not self.full_backend_config_path.exists():
+        elif self.full_backend_config_path and not self._path_listed(self.full_backend_config_path):
             errors.append(f"Backend config file not found: {self.full_backend_config_path}")
         
         # Check for main.tf file
-        if self.full_directory_path:
+        if self.full_directory_path and not probe['has_main_tf']:
             main_tf = self.full_directory_path / "main.tf"
-            if not main_tf.exists():
-                errors.append(f"main.tf not found in challenge directory: {main_tf}")
+            errors.append(f"main.tf not found in challenge directory: {main_tf}")
         
         # Check web content if specified
-        if self.web_content and self.full_web_content_path and not self.full_web_content_path.exists():
+        if (self.web_content and self.full_web_content_path
+                and self._list_dir(self.full_web_content_path) is None):
             errors.append(f"Web content directory not found: {self.full_web_content_path}")
         
         return len(errors) == 0, errors
     
+    def _list_dir(self, directory: Path) -> Optional[List[Tuple[str, bool]]]:
+        """
+        List a directory in a single scan, reusing the result while its mtime is unchanged
+        
+        Args:
+            directory: Directory to list
+            
+        Returns:
+            List of (name, is_file) tuples, or None if the directory doesn't exist
+        """
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+            cached = self._listing_cache.get(directory)
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+            
+            with os.scandir(directory) as it:
+                entries = [(entry.name, entry.is_file()) for entry in it]
+        except OSError:
+            return None
+        
+        self._listing_cache[directory] = (mtime_ns, entries)
+        return entries
+    
+    def _probe_dir(self) -> Dict[str, Any]:
+        """
+        Describe the challenge directory from its cached listing
+        
+        Returns:
+            Dictionary with 'exists', 'has_main_tf' and 'entries' (entry names)
+        """
+        listing = self._list_dir(self.full_directory_path) if self.full_directory_path else None
+        entries = [name for name, _ in listing] if listing is not None else []
+        return {
+            'exists': listing is not None,
+            'has_main_tf': 'main.tf' in entries,
+            'entries': entries
+        }
+    
+    def _path_listed(self, path: Path) -> bool:
+        """Check whether a path exists using the cached listing of its parent directory"""
+        listing = self._list_dir(path.parent)
+        return listing is not None and any(name == path.name for name, _ in listing)
+    
     def get_terraform_files(self) -> List[Path]:
         """
         Get list of Terraform files in challenge directory
@@ -91,14 +274,14 @@ class Challenge:
         Returns:
             List of Terraform file paths
         """
-        if not self.full_directory_path or not self.full_directory_path.exists():
+        if not self.full_directory_path:
             return []
         
-        tf_files = []
-        for pattern in ['*.tf', '*.tfvars', '*.tf.json']:
-            tf_files.extend(self.full_directory_path.glob(pattern))
-        
-        return sorted(tf_files)
+        entries = self._list_dir(self.full_directory_path) or []
+        return sorted(
+            self.full_directory_path / name for name, is_file in entries
+            if is_file and name.endswith(_TERRAFORM_SUFFIXES)
+        )
     
     def get_web_content_files(self) -> List[Path]:
         """
@@ -107,33 +290,200 @@ class Challenge:
         Returns:
             List of web content file paths
         """
-        if not self.full_web_content_path or not self.full_web_content_path.exists():
+        if not self.full_web_content_path:
             return []
         
-        web_files = []
-        for pattern in ['*']:
-            web_files.extend(self.full_web_content_path.glob(pattern))
+        entries = self._list_dir(self.full_web_content_path) or []
+        return [self.full_web_content_path / name for name, is_file in entries if is_file]
+    
+    def state_fingerprint(self) -> Tuple[str, int]:
+        """
+        Get the newest local state marker and its mtime
         
-        return [f for f in web_files if f.is_file()]
+        Returns:
+            Tuple of (marker, mtime_ns), or ('', 0) if the directory is not initialized
+        """
+        for marker in ('terraform.tfstate', '.terraform/terraform.tfstate', '.terraform'):
+            try:
+                return marker, os.stat(self.full_directory_path / marker).st_mtime_ns
+            except OSError:
+                continue
+        return '', 0
+    
+    def invalidate_status(self) -> None:
+        """Drop the cached status, e.g. after deploying or destroying the challenge"""
+        self._status_cache = None
+        self._status_cache_mtime = None
+    
+    def get_backend_type(self) -> Optional[str]:
+        """
+        Get the Terraform backend type this challenge was initialized with
+        
+        Returns:
+            Backend type ('local', 's3', 'gcs', ...), 'none' if the working
+            directory is not initialized, or None if it cannot be determined
+        """
+        if not self.full_directory_path:
+            return None
+        
+        if '.terraform' not in self._probe_dir()['entries']:
+            return 'none'
+        try:
+            backend_state = load_state(self.terraform_dir / 'terraform.tfstate')
+        except (OSError, ValueError):
+            return None
+        if backend_state is None:
+            return 'local'
+        return (backend_state.get('backend') or {}).get('type', 'local')
     
     def get_status_from_terraform_state(self) -> ChallengeStatus:
         """
-        Determine challenge status using Terraform CLI commands
+        Determine challenge status, reusing the last result while the state is unchanged
+        
+        A local terraform.tfstate is tracked by its mtime; state in a remote backend
+        cannot be observed locally, so its status is re-probed after STATUS_CACHE_TTL.
+        
+        Returns:
+            Current challenge status
+        """
+        if not self.full_directory_path:
+            return ChallengeStatus.UNKNOWN
+        
+        fingerprint = self.state_fingerprint()
+        status = self._cached_status(fingerprint)
+        if status is None:
+            status = self._probe_terraform_state()
+            self._store_status(fingerprint, status)
+        return status
+    
+    async def get_status_async(self) -> ChallengeStatus:
+        """
+        Determine challenge status without blocking the event loop
+        
+        Same caching as get_status_from_terraform_state; remote backends are
+        queried with an asyncio subprocess so many challenges can be probed at once.
         
         Returns:
             Current challenge status
         """
+        import asyncio
+        
         if not self.full_directory_path:
             return ChallengeStatus.UNKNOWN
         
-        # Check if Terraform is initialized
-        terraform_dir = self.full_directory_path / '.terraform'
-        if not terraform_dir.exists():
+        fingerprint = await asyncio.to_thread(self.state_fingerprint)
+        status = self._cached_status(fingerprint)
+        if status is not None:
+            return status
+        
+        status = await asyncio.to_thread(self._probe_local_state)
+        if status is None:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    'terraform', 'state', 'list',
+                    cwd=self.full_directory_path,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    self.logger.warning("Terraform state list command timed out")
+                    status = ChallengeStatus.UNKNOWN
+                else:
+                    status = self._status_from_state_list(
+                        process.returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+                    )
+            except FileNotFoundError:
+                self.logger.warning("Terraform command not found")
+                status = ChallengeStatus.UNKNOWN
+            except Exception as e:
+                self.logger.warning(f"Error checking Terraform state: {e}")
+                status = ChallengeStatus.UNKNOWN
+        
+        self._store_status(fingerprint, status)
+        return status
+    
+    def _cached_status(self, fingerprint: Tuple[str, int]) -> Optional[ChallengeStatus]:
+        """Get the cached status if it is still valid for this state fingerprint"""
+        if self._status_cache is not None and self._status_cache_mtime == fingerprint:
+            if (fingerprint[0] != '.terraform/terraform.tfstate'
+                    or time.monotonic() - self._status_cache_time < STATUS_CACHE_TTL):
+                return self._status_cache
+        return None
+    
+    def _store_status(self, fingerprint: Tuple[str, int], status: ChallengeStatus) -> None:
+        """Cache a probed status against the state fingerprint it was probed at"""
+        self._status_cache_mtime = fingerprint
+        self._status_cache_time = time.monotonic()
+        self._status_cache = status
+    
+    def _probe_local_state(self) -> Optional[ChallengeStatus]:
+        """
+        Determine challenge status without the Terraform CLI, where possible
+        
+        Returns:
+            Status for uninitialized and local-backend challenges, or None when the
+            state lives in a remote backend (or the local state cannot be read)
+        """
+        backend = self.get_backend_type()
+        
+        # Not initialized, nothing can be deployed
+        if backend == 'none':
             return ChallengeStatus.NOT_DEPLOYED
         
-        try:
-            import subprocess
+        if backend == 'local':
+            try:
+                state = load_state(self.state_file)
+                return ChallengeStatus.DEPLOYED if state and state.get('resources') else ChallengeStatus.NOT_DEPLOYED
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Could not read local Terraform state: {e}")
+        
+        return None
+    
+    def _status_from_state_list(self, returncode: int, stdout: str, stderr: str) -> ChallengeStatus:
+        """
+        Classify the result of 'terraform state list'
+        
+        Args:
+            returncode: Process return code
+            stdout: Standard output (one resource address per line)
+            stderr: Standard error
             
+        Returns:
+            Challenge status
+        """
+        if returncode == 0:
+            # If we have output, there are resources in state
+            if stdout.strip():
+                return ChallengeStatus.DEPLOYED
+            else:
+                return ChallengeStatus.NOT_DEPLOYED
+        
+        # Check if it's because no state file exists
+        if "No state file was found" in stderr or "Failed to load state" in stderr:
+            return ChallengeStatus.NOT_DEPLOYED
+        
+        self.logger.warning(f"Terraform state list failed: {stderr}")
+        return ChallengeStatus.UNKNOWN
+    
+    def _probe_terraform_state(self) -> ChallengeStatus:
+        """
+        Determine challenge status from Terraform state
+        
+        Local-backend state is read straight from terraform.tfstate; only remote
+        backends need the Terraform CLI ('terraform state list').
+        
+        Returns:
+            Current challenge status
+        """
+        status = self._probe_local_state()
+        if status is not None:
+            return status
+        
+        try:
             # Use 'terraform state list' to check for resources
             result = subprocess.run(
                 ['terraform', 'state', 'list'],
@@ -142,21 +492,8 @@ class Challenge:
                 text=True,
                 timeout=30
             )
+            return self._status_from_state_list(result.returncode, result.stdout, result.stderr)
             
-            if result.returncode == 0:
-                # If we have output, there are resources in state
-                if result.stdout.strip():
-                    return ChallengeStatus.DEPLOYED
-                else:
-                    return ChallengeStatus.NOT_DEPLOYED
-            else:
-                # Check if it's because no state file exists
-                if "No state file was found" in result.stderr or "Failed to load state" in result.stderr:
-                    return ChallengeStatus.NOT_DEPLOYED
-                else:
-                    self.logger.warning(f"Terraform state list failed: {result.stderr}")
-                    return ChallengeStatus.UNKNOWN
-                    
         except subprocess.TimeoutExpired:
             self.logger.warning("Terraform state list command timed out")
             return ChallengeStatus.UNKNOWN
@@ -184,36 +521,62 @@ class Challenge:
         
         # Get credentials for this provider to resolve variables
         try:
-            from .credential_manager import CredentialManager
-            from .config_loader import ConfigLoader
-            config_loader = ConfigLoader(self.base_path / "config")
-            cred_manager = CredentialManager(config_loader)
+            ConfigLoader, CredentialManager, _ = _get_managers()
+            config_loader = ConfigLoader.instance(self.base_path / "config")
+            cred_manager = CredentialManager.instance(config_loader)
             provider_creds = cred_manager.get_provider_credentials(self.provider)
         except Exception as e:
             self.logger.warning(f"Could not get credentials for variable resolution: {e}")
             provider_creds = {}
         
+        # Resolved ${...} references, shared by every variable in this file
+        lookups: Dict[str, Any] = self._resolve_dependencies()
+        
         for key, value in self.variables.items():
-            resolved_value = self._resolve_variable_value(value, provider_creds)
-            
-            if isinstance(resolved_value, str):
-                lines.append(f'{key} = "{resolved_value}"')
-            elif isinstance(resolved_value, bool):
-                lines.append(f'{key} = {str(resolved_value).lower()}')
-            elif isinstance(resolved_value, (int, float)):
-                lines.append(f'{key} = {resolved_value}')
-            else:
-                lines.append(f'{key} = "{str(resolved_value)}"')
+            resolved_value = self._resolve_variable_value(value, provider_creds, lookups)
+            formatter = _TFVARS_FORMATTERS.get(type(resolved_value), _format_tfvars_string)
+            lines.append(formatter(key, resolved_value))
         
         return '\n'.join(lines) + '\n'
     
-    def _resolve_variable_value(self, value: Any, provider_creds: Dict[str, Any]) -> Any:
+    def _resolve_dependencies(self) -> Dict[str, str]:
+        """
+        Resolve all challenge dependency references in variables concurrently
+        
+        Each dependency needs a status check and 'terraform output' on another
+        challenge, so several references are resolved in parallel.
+        
+        Returns:
+            Dictionary mapping each 'challenge-name.output-name' reference to its value
+        """
+        references = {
+            var_name
+            for value in self.variables.values() if isinstance(value, str)
+            for var_name in _VAR_RE.findall(value) if '.' in var_name
+        }
+        if not references:
+            return {}
+        if len(references) == 1:
+            reference = references.pop()
+            return {reference: self._resolve_challenge_dependency(reference)}
+        
+        with ThreadPoolExecutor(max_workers=min(len(references), 8)) as executor:
+            futures = {ref: executor.submit(self._resolve_challenge_dependency, ref)
+                       for ref in references}
+        return {ref: future.result() for ref, future in futures.items()}
+    
+    def _resolve_variable_value(self, value: Any, provider_creds: Dict[str, Any],
+                                lookups: Optional[Dict[str, Any]] = None) -> Any:
         """
         Resolve variable value, handling environment variables and challenge dependencies
         
+        A value that is a single ${VAR_NAME} reference resolves to the referenced
+        value itself; references embedded in a longer string are interpolated.
+        
         Args:
             value: Original value from config
             provider_creds: Provider credentials dictionary
+            lookups: Already resolved references, updated with new ones
             
         Returns:
             Resolved value
@@ -221,92 +584,142 @@ class Challenge:
         if not isinstance(value, str):
             return value
         
-        # Check if value is in format ${VAR_NAME}
-        if value.startswith('${') and value.endswith('}'):
-            var_name = value[2:-1]  # Remove ${ and }
-            
-            # Check if this is a challenge dependency (pattern: challenge-name.output-name)
-            if '.' in var_name:
-                return self._resolve_challenge_dependency(var_name)
-            
-            # Map common variable names to credential keys
-            var_mapping = {
-                'AZURE_SUBSCRIPTION_ID': 'subscription_id',
-                'AZURE_TENANT_ID': 'tenant_id', 
-                'AZURE_CLIENT_ID': 'client_id',
-                'AZURE_CLIENT_SECRET': 'client_secret',
-                'AWS_ACCESS_KEY_ID': 'access_key_id',
-                'AWS_SECRET_ACCESS_KEY': 'secret_access_key',
-                'GCP_PROJECT_ID': 'project_id',
-                'GCP_REGION': 'region',
-                'GCP_USER_EMAIL': 'user_email'
-            }
-            
-            # Try to get from provider credentials first
-            if var_name in var_mapping:
-                cred_key = var_mapping[var_name]
-                if cred_key in provider_creds:
-                    resolved = provider_creds[cred_key]
-                    self.logger.info(f"Resolved {var_name} from provider credentials")
-                    return resolved
+        if lookups is None:
+            lookups = {}
+        
+        match = _VAR_RE.fullmatch(value)
+        if match:
+            return self._lookup(match.group(1), provider_creds, lookups)
+        
+        return _VAR_RE.sub(lambda m: str(self._lookup(m.group(1), provider_creds, lookups)), value)
+    
+    def _lookup(self, var_name: str, provider_creds: Dict[str, Any],
+                lookups: Dict[str, Any]) -> Any:
+        """
+        Resolve a single ${VAR_NAME} reference
+        
+        Args:
+            var_name: Referenced name (without ${ and })
+            provider_creds: Provider credentials dictionary
+            lookups: Already resolved references, updated with this one
             
+        Returns:
+            Resolved value, or the original ${VAR_NAME} text if it cannot be resolved
+        """
+        if var_name in lookups:
+            return lookups[var_name]
+        
+        # Check if this is a challenge dependency (pattern: challenge-name.output-name)
+        if '.' in var_name:
+            resolved = self._resolve_challenge_dependency(var_name)
+            lookups[var_name] = resolved
+            return resolved
+        
+        # Try to get from provider credentials first
+        cred_key = self._VAR_MAPPING.get(var_name)
+        if cred_key and cred_key in provider_creds:
+            resolved = provider_creds[cred_key]
+            self.logger.info(f"Resolved {var_name} from provider credentials")
+        else:
             # Fall back to environment variable
-            import os
             resolved = os.getenv(var_name)
             if resolved:
                 self.logger.info(f"Resolved {var_name} from environment variable")
-                return resolved
-            
-            # If still not found, log warning but return original
-            self.logger.warning(f"Could not resolve variable {var_name}, using original value")
-            return value
+            else:
+                # If still not found, log warning but keep the original reference
+                self.logger.warning(f"Could not resolve variable {var_name}, using original value")
+                resolved = f"${{{var_name}}}"
         
-        return value
+        lookups[var_name] = resolved
+        return resolved
 
-    def _resolve_challenge_dependency(self, dependency: str) -> str:
+    @classmethod
+    def invalidate_outputs_cache(cls, challenge_name: Optional[str] = None) -> None:
         """
-        Resolve a challenge dependency in format 'challenge-name.output-name'
+        Forget cached dependency outputs, e.g. after a challenge is applied or destroyed
         
         Args:
-            dependency: Dependency string like 'challenge-01-azure-only.azure_ad_app_display_name'
+            challenge_name: Challenge whose outputs changed (all challenges if None)
+        """
+        with cls._dep_outputs_lock:
+            if challenge_name is None:
+                cls._dep_outputs_cache.clear()
+            else:
+                cls._dep_outputs_cache.pop(challenge_name, None)
+    
+    def _get_dependency_outputs(self, challenge_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get all outputs of a deployed dependency challenge, fetching them once per process
+        
+        Args:
+            challenge_name: Name of the dependency challenge
             
         Returns:
-            Resolved output value or original dependency if resolution fails
+            Outputs dictionary, or None if the dependency is missing, not deployed
+            or its outputs could not be read
         """
-        try:
-            parts = dependency.split('.', 1)
-            if len(parts) != 2:
-                self.logger.warning(f"Invalid dependency format: {dependency}")
-                return f"${{{dependency}}}"
-            
-            challenge_name, output_name = parts
+        with self._dep_outputs_lock:
+            name_lock = self._dep_fetch_locks.setdefault(challenge_name, threading.Lock())
+        
+        # Concurrent references to the same dependency wait for a single fetch
+        with name_lock:
+            with self._dep_outputs_lock:
+                cached = self._dep_outputs_cache.get(challenge_name)
+            if cached is not None:
+                return cached
             
-            # Import here to avoid circular imports
-            from .terraform_manager import TerraformManager
-            from .credential_manager import CredentialManager
-            from .config_loader import ConfigLoader
+            ConfigLoader, CredentialManager, TerraformManager = _get_managers()
             
-            # Initialize managers
-            config_loader = ConfigLoader(self.base_path / "config")
-            credential_manager = CredentialManager(config_loader)
+            # Initialize managers (the config loader is shared)
+            config_loader = ConfigLoader.instance(self.base_path / "config")
+            credential_manager = CredentialManager.instance(config_loader)
             terraform_manager = TerraformManager(credential_manager)
             
             # Get the dependency challenge
             dependency_config = config_loader.get_challenge_config(challenge_name)
             if not dependency_config:
                 self.logger.error(f"Dependency challenge not found: {challenge_name}")
-                return f"${{{dependency}}}"
+                return None
             
             dependency_challenge = Challenge(challenge_name, dependency_config, self.base_path)
             
             # Check if dependency is deployed
             if dependency_challenge.get_status_from_terraform_state() != ChallengeStatus.DEPLOYED:
                 self.logger.error(f"Dependency challenge {challenge_name} is not deployed")
-                return f"${{{dependency}}}"
+                return None
             
             # Get outputs from dependency challenge
             success, outputs = terraform_manager.get_outputs(dependency_challenge)
-            if not success or output_name not in outputs:
+            if not success:
+                self.logger.error(f"Could not get outputs from {challenge_name}")
+                return None
+            
+            with self._dep_outputs_lock:
+                self._dep_outputs_cache[challenge_name] = outputs
+            return outputs
+    
+    def _resolve_challenge_dependency(self, dependency: str) -> str:
+        """
+        Resolve a challenge dependency in format 'challenge-name.output-name'
+        
+        Args:
+            dependency: Dependency string like 'challenge-01-azure-only.azure_ad_app_display_name'
+            
+        Returns:
+            Resolved output value or original dependency if resolution fails
+        """
+        try:
+            parts = dependency.split('.', 1)
+            if len(parts) != 2:
+                self.logger.warning(f"Invalid dependency format: {dependency}")
+                return f"${{{dependency}}}"
+            
+            challenge_name, output_name = parts
+            
+            outputs = self._get_dependency_outputs(challenge_name)
+            if outputs is None:
+                return f"${{{dependency}}}"
+            if output_name not in outputs:
                 self.logger.error(f"Could not get output {output_name} from {challenge_name}")
                 return f"${{{dependency}}}"
             
@@ -322,18 +735,35 @@ class Challenge:
         """
         Create terraform.tfvars file in challenge directory
         
+        The file is left untouched if it is still the one last written with
+        identical content.
+        
         Returns:
             Path to created variables file
         """
         if not self.full_directory_path:
             raise ValueError("Challenge directory not set")
         
-        tfvars_path = self.full_directory_path / "terraform.tfvars"
+        tfvars_path = self.tfvars_path
         
         content = self.get_terraform_variables_file_content()
         
-        with open(tfvars_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if self._tfvars_written and self._tfvars_written[0] == content:
+            try:
+                if os.stat(tfvars_path).st_mtime_ns == self._tfvars_written[1]:
+                    return tfvars_path
+            except OSError:
+                pass
+        
+        data = memoryview(content.encode('utf-8'))
+        fd = os.open(tfvars_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            mtime_ns = os.fstat(fd).st_mtime_ns
+        finally:
+            os.close(fd)
+        self._tfvars_written = (content, mtime_ns)
         
         self.logger.debug(f"Created terraform.tfvars for {self.name}: {tfvars_path}")
         return tfvars_path
@@ -345,14 +775,42 @@ class Challenge:
         Returns:
             Challenge summary dictionary
         """
-        is_valid, errors = self.validate()
+        return self._build_summary(
+            self.validate(),
+            self.get_status_from_terraform_state(),
+            self.get_terraform_files(),
+            self.get_web_content_files()
+        )
+    
+    async def get_summary_async(self) -> Dict[str, Any]:
+        """
+        Get challenge summary information, running its filesystem checks and
+        Terraform status probe concurrently
+        
+        Returns:
+            Challenge summary dictionary
+        """
+        import asyncio
+        
+        validation, status, terraform_files, web_content_files = await asyncio.gather(
+            asyncio.to_thread(self.validate),
+            self.get_status_async(),
+            asyncio.to_thread(self.get_terraform_files),
+            asyncio.to_thread(self.get_web_content_files)
+        )
+        return self._build_summary(validation, status, terraform_files, web_content_files)
+    
+    def _build_summary(self, validation: Tuple[bool, List[str]], status: ChallengeStatus,
+                       terraform_files: List[Path], web_content_files: List[Path]) -> Dict[str, Any]:
+        """Assemble the summary dictionary from already computed parts"""
+        is_valid, errors = validation
         
         return {
             'name': self.name,
             'provider': self.provider,
             'difficulty': self.difficulty,
             'description': self.description,
-            'status': self.get_status_from_terraform_state().value,
+            'status': status.value,
             'directory': str(self.directory),
             'backend_config': str(self.backend_config),
             'web_content': str(self.web_content) if self.web_content else None,
@@ -361,8 +819,8 @@ class Challenge:
             'outputs': self.outputs,
             'valid': is_valid,
             'errors': errors,
-            'terraform_files': [str(f.name) for f in self.get_terraform_files()],
-            'web_content_files': [str(f.name) for f in self.get_web_content_files()]
+            'terraform_files': [str(f.name) for f in terraform_files],
+            'web_content_files': [str(f.name) for f in web_content_files]
         }
     
     def __str__(self) -> str:
@@ -4,20 +4,102 @@ Handles loading and parsing of challenges.yaml and credentials.yaml
 """
 
 import os
+import re
+import copy
+import mmap
+import threading
 import yaml
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from .challenge import Challenge
 from .logger import get_logger
 
+# ${VAR_NAME} references in configuration values
+_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# Use the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _env_or_reference(match: re.Match) -> str:
+    """Replace a ${VAR_NAME} match with the environment variable, keeping it if unset"""
+    return os.environ.get(match.group(1), match.group(0))
+
+
+def _read_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file through a read-only memory map
+    
+    The parser reads the mapped bytes directly, so the file is neither copied
+    into a Python string nor decoded up front.
+    
+    Args:
+        path: YAML file path
+        
+    Returns:
+        Parsed YAML document (None for an empty file)
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            # Empty files cannot be mapped
+            return None
+        with mmap.mmap(fd, 0, prot=mmap.PROT_READ) as mm:
+            return yaml.load(mm, Loader=_YamlLoader)
+    finally:
+        os.close(fd)
+
 
 class ConfigLoader:
     """Loads and manages configuration files for CTF challenges"""
     
+    __slots__ = ('config_dir', 'logger', 'challenges_config', 'credentials_config',
+                 '_by_provider', '_by_difficulty')
+    
+    # Fields every challenge config must set, in reporting order
+    REQUIRED_FIELDS = ('name', 'provider', 'directory', 'backend_config')
+    
+    # Parsed YAML files by path, reused while their mtime is unchanged; every
+    # loader gets its own deep copy, so mutating one never leaks into another
+    _yaml_cache: Dict[str, Tuple[int, Any]] = {}
+    _yaml_cache_lock = threading.Lock()
+    
+    # Shared loaders by config directory (see instance())
+    _instances: Dict[str, 'ConfigLoader'] = {}
+    _instances_lock = threading.Lock()
+    
     def __init__(self, config_dir: str = "config"):
         self.config_dir = Path(config_dir)
         self.logger = get_logger()
         self.challenges_config = None
         self.credentials_config = None
+        
+        # Challenge configs indexed by provider and difficulty, rebuilt on each load
+        self._by_provider: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._by_difficulty: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    
+    @classmethod
+    def instance(cls, config_dir: str = "config") -> 'ConfigLoader':
+        """
+        Get the shared ConfigLoader for a configuration directory
+        
+        Args:
+            config_dir: Configuration directory
+            
+        Returns:
+            ConfigLoader instance, created on first use
+        """
+        key = str(Path(config_dir).resolve())
+        with cls._instances_lock:
+            loader = cls._instances.get(key)
+            if loader is None:
+                loader = cls._instances[key] = cls(config_dir)
+        return loader
     
     def load_challenges_config(self, config_file: str = "challenges.yaml") -> Dict[str, Any]:
         """
@@ -35,8 +117,20 @@ class ConfigLoader:
             raise FileNotFoundError(f"Challenges config file not found: {config_path}")
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.challenges_config = yaml.safe_load(f)
+            cache_key = str(config_path)
+            mtime_ns = config_path.stat().st_mtime_ns
+            with self._yaml_cache_lock:
+                cached = self._yaml_cache.get(cache_key)
+            if cached and cached[0] == mtime_ns:
+                self.challenges_config = copy.deepcopy(cached[1])
+                self._index_challenges()
+                self.logger.debug(f"Using cached challenges config from {config_path}")
+                return self.challenges_config
+            
+            self.challenges_config = _read_yaml(config_path)
+            with self._yaml_cache_lock:
+                self._yaml_cache[cache_key] = (mtime_ns, copy.deepcopy(self.challenges_config))
+            self._index_challenges()
             
             self.logger.info(f"Loaded challenges config from {config_path}")
             return self.challenges_config
@@ -48,6 +142,18 @@ class ConfigLoader:
             self.logger.error(f"Error loading config file: {e}")
             raise
     
+    def _index_challenges(self) -> None:
+        """Index the loaded challenge configs by provider and difficulty in one pass"""
+        by_provider = defaultdict(dict)
+        by_difficulty = defaultdict(dict)
+        
+        for name, config in ((self.challenges_config or {}).get('challenges') or {}).items():
+            by_provider[config.get('provider')][name] = config
+            by_difficulty[config.get('difficulty')][name] = config
+        
+        self._by_provider = dict(by_provider)
+        self._by_difficulty = dict(by_difficulty)
+    
     def load_credentials_config(self, config_file: str = "credentials.yaml") -> Dict[str, Any]:
         """
         Load credentials configuration
@@ -66,8 +172,7 @@ class ConfigLoader:
             return {}
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.credentials_config = yaml.safe_load(f)
+            self.credentials_config = _read_yaml(config_path)
             
             self.logger.info(f"Loaded credentials config from {config_path}")
             return self.credentials_config
@@ -107,6 +212,48 @@ class ConfigLoader:
         
         return self.challenges_config.get('challenges', {})
     
+    def get_all_summaries(self, max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Get summaries for all challenges, querying Terraform state concurrently
+        
+        Args:
+            max_workers: Maximum number of challenges summarized at once
+            
+        Returns:
+            Dictionary mapping challenge names to their summaries
+        """
+        base_path = self.config_dir.parent
+        challenges = [
+            Challenge(name, config, base_path)
+            for name, config in self.get_all_challenges().items()
+        ]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            summaries = list(executor.map(lambda c: c.get_summary(), challenges))
+        
+        return {challenge.name: summary for challenge, summary in zip(challenges, summaries)}
+    
+    async def get_all_summaries_async(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get summaries for all challenges from a single event loop
+        
+        Filesystem checks run in worker threads and remote-backend status probes
+        run as asyncio subprocesses, all in flight at once.
+        
+        Returns:
+            Dictionary mapping challenge names to their summaries
+        """
+        import asyncio
+        
+        base_path = self.config_dir.parent
+        challenges = [
+            Challenge(name, config, base_path)
+            for name, config in self.get_all_challenges().items()
+        ]
+        
+        summaries = await asyncio.gather(*(c.get_summary_async() for c in challenges))
+        return {challenge.name: summary for challenge, summary in zip(challenges, summaries)}
+    
     def get_challenges_by_provider(self, provider: str) -> Dict[str, Dict[str, Any]]:
         """
         Get challenges filtered by cloud provider
@@ -117,11 +264,10 @@ class ConfigLoader:
         Returns:
             Dictionary of challenges for the specified provider
         """
-        all_challenges = self.get_all_challenges()
-        return {
-            name: config for name, config in all_challenges.items()
-            if config.get('provider') == provider
-        }
+        if not self.challenges_config:
+            self.load_challenges_config()
+        
+        return dict(self._by_provider.get(provider, {}))
     
     def get_challenges_by_difficulty(self, difficulty: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -133,11 +279,10 @@ class ConfigLoader:
         Returns:
             Dictionary of challenges for the specified difficulty
         """
-        all_challenges = self.get_all_challenges()
-        return {
-            name: config for name, config in all_challenges.items()
-            if config.get('difficulty') == difficulty
-        }
+        if not self.challenges_config:
+            self.load_challenges_config()
+        
+        return dict(self._by_difficulty.get(difficulty, {}))
     
     def get_global_config(self) -> Dict[str, Any]:
         """
@@ -185,18 +330,17 @@ class ConfigLoader:
             return errors
         
         # Required fields
-        required_fields = ['name', 'provider', 'directory', 'backend_config']
-        for field in required_fields:
-            if not config.get(field):
-                errors.append(f"Missing required field '{field}' for challenge '{challenge_name}'")
+        errors.extend(
+            f"Missing required field '{field}' for challenge '{challenge_name}'"
+            for field in self.REQUIRED_FIELDS if not config.get(field)
+        )
         
         # Validate provider
-        valid_providers = ['aws', 'azure', 'gcp']
         provider = config.get('provider')
-        if provider and provider not in valid_providers:
-            errors.append(f"Invalid provider '{provider}'. Must be one of: {valid_providers}")
+        if provider and provider not in Challenge.VALID_PROVIDERS:
+            errors.append(f"Invalid provider '{provider}'. Must be one of: {sorted(Challenge.VALID_PROVIDERS)}")
         
-        # Check if directories exist
+        # Check if paths exist (relative to the working directory)
         if config.get('directory'):
             challenge_dir = Path(config['directory'])
             if not challenge_dir.exists():
@@ -219,14 +363,22 @@ class ConfigLoader:
         Returns:
             Configuration with environment variables substituted
         """
-        def substitute_value(value):
-            if isinstance(value, str) and value.startswith('${') and value.endswith('}'):
-                env_var = value[2:-1]
-                return os.getenv(env_var, value)
-            elif isinstance(value, dict):
-                return {k: substitute_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [substitute_value(item) for item in value]
-            return value
-        
-        return substitute_value(config)
+        # Walk the tree with an explicit stack of (container, key) slots, replacing
+        # each container with a copy so the cached configuration is never mutated
+        root = [config]
+        stack = [(root, 0)]
+        while stack:
+            parent, key = stack.pop()
+            value = parent[key]
+            value_type = type(value)
+            
+            if value_type is str:
+                parent[key] = _VAR_RE.sub(_env_or_reference, value)
+            elif value_type is dict:
+                parent[key] = value = dict(value)
+                stack.extend((value, k) for k in value)
+            elif value_type is list:
+                parent[key] = value = list(value)
+                stack.extend((value, i) for i in range(len(value)))
+        
+        return root[0]
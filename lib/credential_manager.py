@@ -4,20 +4,327 @@ Handles cloud provider credentials and environment variables
 """
 
 import os
-from typing import Dict, Any, Optional
+import functools
+import json
+import re
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from .config_loader import ConfigLoader
 from .logger import get_logger
 
 
+# Whole-value environment variable reference in challenge variables: ${VAR}
+_REF_RE = re.compile(r'\$\{(.*)\}', re.DOTALL)
+
+# Seconds Azure CLI / gcloud lookups are reused, across CredentialManager
+# instances and (via the disk cache) across ctf-manager invocations
+CLI_CACHE_TTL = 300
+
+_cli_cache: Dict[Tuple[str, ...], Tuple[float, List[List[Any]], subprocess.CompletedProcess]] = {}
+_cli_cache_lock = threading.Lock()
+
+
+def _cli_config_files(tool: str) -> List[str]:
+    """
+    Get the configuration files a cloud CLI reads its active account/project from
+    
+    Args:
+        tool: CLI executable ('az' or 'gcloud')
+        
+    Returns:
+        File paths ('az account set' / 'gcloud config set' rewrite these)
+    """
+    home = os.path.expanduser('~')
+    if tool == 'az':
+        config_dir = os.environ.get('AZURE_CONFIG_DIR') or os.path.join(home, '.azure')
+        return [os.path.join(config_dir, 'azureProfile.json')]
+    
+    if tool == 'gcloud':
+        config_dir = os.environ.get('CLOUDSDK_CONFIG')
+        if not config_dir:
+            if os.name == 'nt' and os.environ.get('APPDATA'):
+                config_dir = os.path.join(os.environ['APPDATA'], 'gcloud')
+            else:
+                config_dir = os.path.join(home, '.config', 'gcloud')
+        active_config = os.path.join(config_dir, 'active_config')
+        
+        name = os.environ.get('CLOUDSDK_ACTIVE_CONFIG_NAME')
+        if not name:
+            try:
+                with open(active_config, 'r', encoding='utf-8') as f:
+                    name = f.read().strip()
+            except OSError:
+                pass
+        return [active_config,
+                os.path.join(config_dir, 'configurations', f"config_{name or 'default'}")]
+    
+    return []
+
+
+def _cli_config_signature(command: Tuple[str, ...]) -> List[List[Any]]:
+    """
+    Describe the CLI configuration a cached result was produced under
+    
+    Args:
+        command: Command and arguments
+        
+    Returns:
+        JSON-compatible list of [path, mtime_ns] for the CLI's config files
+        (-1 if missing), plus any CLOUDSDK_* overrides for gcloud
+    """
+    signature = []
+    for path in _cli_config_files(command[0]):
+        try:
+            signature.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            signature.append([path, -1])
+    if command[0] == 'gcloud':
+        signature.extend([name, value] for name, value in sorted(os.environ.items())
+                         if name.startswith('CLOUDSDK_'))
+    return signature
+
+
+def _cli_cache_path(command: Tuple[str, ...]) -> Path:
+    """Get the disk cache file for a CLI command (~/.cache/ctf-manager/<command>.json)"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    name = re.sub(r'[^A-Za-z0-9]+', '-', ' '.join(command)).strip('-')
+    return Path(cache_home) / 'ctf-manager' / f"{name}.json"
+
+
+def _read_cli_disk_cache(command: Tuple[str, ...],
+                         signature: List[List[Any]]) -> Optional[Tuple[float, subprocess.CompletedProcess]]:
+    """
+    Load a CLI result cached on disk by an earlier run
+    
+    Args:
+        command: Command and arguments
+        signature: Current CLI configuration (see _cli_config_signature)
+        
+    Returns:
+        Tuple of (monotonic timestamp, result), or None if missing, stale,
+        produced under a different CLI configuration or unreadable
+    """
+    path = _cli_cache_path(command)
+    try:
+        age = time.time() - path.stat().st_mtime
+        if not 0 <= age < CLI_CACHE_TTL:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('config') != signature:
+            return None
+        result = subprocess.CompletedProcess(list(command), data['returncode'],
+                                             data['stdout'], data['stderr'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return time.monotonic() - age, result
+
+
+def _write_cli_disk_cache(command: Tuple[str, ...], signature: List[List[Any]],
+                          result: subprocess.CompletedProcess):
+    """
+    Persist a CLI result for later runs (owner-only file, replaced atomically)
+    
+    Args:
+        command: Command and arguments
+        signature: CLI configuration the result was produced under
+        result: Completed process to store
+    """
+    path = _cli_cache_path(command)
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates the file with 0600 permissions
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'config': signature,
+                           'returncode': result.returncode,
+                           'stdout': result.stdout,
+                           'stderr': result.stderr}, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # The disk cache is only an optimization
+        pass
+
+
+def _run_cli_cached(command: Tuple[str, ...]) -> subprocess.CompletedProcess:
+    """
+    Run a read-only cloud CLI command, reusing its result for CLI_CACHE_TTL seconds
+    
+    A cached result is discarded as soon as the CLI's configuration changes,
+    e.g. after 'az account set' or 'gcloud config set project'.
+    
+    Args:
+        command: Command and arguments
+        
+    Returns:
+        Completed process (stdout/stderr captured as text)
+        
+    Raises:
+        subprocess.TimeoutExpired, FileNotFoundError: As raised by subprocess.run
+    """
+    signature = _cli_config_signature(command)
+    
+    with _cli_cache_lock:
+        cached = _cli_cache.get(command)
+    if cached and time.monotonic() - cached[0] < CLI_CACHE_TTL and cached[1] == signature:
+        return cached[2]
+    
+    from_disk = _read_cli_disk_cache(command, signature)
+    if from_disk:
+        with _cli_cache_lock:
+            _cli_cache[command] = (from_disk[0], signature, from_disk[1])
+        return from_disk[1]
+    
+    result = subprocess.run(list(command), capture_output=True, text=True, timeout=10)
+    
+    with _cli_cache_lock:
+        _cli_cache[command] = (time.monotonic(), signature, result)
+    # Only successful lookups outlive this process, so a fixed login is seen at once
+    if result.returncode == 0:
+        _write_cli_disk_cache(command, signature, result)
+    return result
+
+
+def _azure_cli_account() -> subprocess.CompletedProcess:
+    """Get the active Azure CLI subscription and tenant IDs ('az account show'), as TSV"""
+    return _run_cli_cached(('az', 'account', 'show', '--query', '[id,tenantId]', '--output', 'tsv'))
+
+
+def _gcloud_config(key: str) -> subprocess.CompletedProcess:
+    """Get a gcloud CLI configuration value ('gcloud config get-value <key>')"""
+    return _run_cli_cached(('gcloud', 'config', 'get-value', key))
+
+
+def _lookup(config: Dict[str, Any], key: str, env_var: str, default: Any = None) -> Any:
+    """
+    Get a credential from config, falling back to the environment only when absent
+    
+    Args:
+        config: Provider section of the credentials config
+        key: Config key
+        env_var: Environment variable consulted if the key is not configured
+        default: Value used when neither provides one
+        
+    Returns:
+        Configured value, environment value or default
+    """
+    if key in config:
+        return config[key]
+    return os.environ.get(env_var, default)
+
+
+@functools.lru_cache(maxsize=1)
+def _terraform_version() -> Tuple[bool, Optional[str]]:
+    """
+    Run 'terraform version' once per process
+    
+    Returns:
+        Tuple of (is_installed, version_string)
+    """
+    try:
+        result = subprocess.run(['terraform', 'version'], 
+                              capture_output=True, text=True, timeout=10)
+        if result.returncode == 0:
+            version_line = result.stdout.split('\n')[0]
+            return True, version_line
+        else:
+            return False, None
+    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+        return False, None
+
+
+def _gcloud_core_config() -> Optional[Dict[str, Any]]:
+    """
+    Get the [core] section of the gcloud CLI configuration in a single call
+    
+    Returns:
+        Core configuration (empty if gcloud failed), or None if its JSON output
+        could not be parsed
+    """
+    result = _run_cli_cached(('gcloud', 'config', 'list', '--format=json'))
+    if result.returncode != 0:
+        return {}
+    
+    try:
+        core = json.loads(result.stdout).get('core', {})
+    except (json.JSONDecodeError, AttributeError):
+        return None
+    return core if isinstance(core, dict) else None
+
+
 class CredentialManager:
     """Manages cloud provider credentials and environment setup"""
     
+    # Credential key -> environment variable, per provider
+    _ENV_MAP = {
+        'aws': (('profile', 'AWS_PROFILE'),
+                ('region', 'AWS_DEFAULT_REGION'),
+                ('access_key_id', 'AWS_ACCESS_KEY_ID'),
+                ('secret_access_key', 'AWS_SECRET_ACCESS_KEY'),
+                ('session_token', 'AWS_SESSION_TOKEN')),
+        'azure': (('subscription_id', 'AZURE_SUBSCRIPTION_ID'),
+                  ('tenant_id', 'AZURE_TENANT_ID'),
+                  ('client_id', 'AZURE_CLIENT_ID'),
+                  ('client_secret', 'AZURE_CLIENT_SECRET')),
+        'gcp': (('project_id', 'GCP_PROJECT_ID'),
+                ('region', 'GCP_REGION'),
+                ('user_email', 'GCP_USER_EMAIL'),
+                ('credentials_file', 'GOOGLE_APPLICATION_CREDENTIALS'))
+    }
+    
+    # Environment variables each provider's credentials are derived from
+    _CREDENTIAL_ENV_VARS = {
+        provider: tuple(env_var for _, env_var in mapping)
+        for provider, mapping in _ENV_MAP.items()
+    }
+    
+    # CLI each provider's credentials may be detected from
+    _PROVIDER_CLIS = {
+        'azure': 'az',
+        'gcp': 'gcloud'
+    }
+    
+    # Shared managers by config loader (see instance())
+    _instances: Dict[int, 'CredentialManager'] = {}
+    _instances_lock = threading.Lock()
+    
     def __init__(self, config_loader: ConfigLoader):
         self.config_loader = config_loader
         self.logger = get_logger()
         self.credentials = {}
         self._load_credentials()
+        
+        # Resolved credentials keyed by (provider, *environment values, CLI config)
+        self._cred_cache: Dict[Tuple, Dict[str, Any]] = {}
+        self._cred_lock = threading.Lock()
+    
+    @classmethod
+    def instance(cls, config_loader: ConfigLoader) -> 'CredentialManager':
+        """
+        Get the shared CredentialManager for a config loader
+        
+        Args:
+            config_loader: Configuration loader (e.g. ConfigLoader.instance())
+            
+        Returns:
+            CredentialManager instance, created on first use
+        """
+        # The manager keeps a reference to its loader, so the id stays unique
+        key = id(config_loader)
+        with cls._instances_lock:
+            manager = cls._instances.get(key)
+            if manager is None:
+                manager = cls._instances[key] = cls(config_loader)
+        return manager
     
     def _load_credentials(self):
         """Load credentials from configuration and environment"""
@@ -28,6 +335,32 @@ class CredentialManager:
             self.logger.warning(f"Could not load credentials file: {e}")
             self.credentials = {}
     
+    def _cached_credentials(self, provider: str,
+                            build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get provider credentials, rebuilding them only when the relevant environment
+        or the provider CLI's configuration (e.g. 'az account set') changes
+        
+        Args:
+            provider: Cloud provider name
+            build: Function resolving the credentials from config, environment and CLIs
+            
+        Returns:
+            Copy of the provider credentials dictionary
+        """
+        key = (provider,) + tuple(os.environ.get(var) for var in self._CREDENTIAL_ENV_VARS[provider])
+        tool = self._PROVIDER_CLIS.get(provider)
+        if tool:
+            key += tuple(tuple(entry) for entry in _cli_config_signature((tool,)))
+        
+        # Held while building so concurrent callers share one CLI lookup
+        with self._cred_lock:
+            credentials = self._cred_cache.get(key)
+            if credentials is None:
+                credentials = self._cred_cache[key] = build()
+        
+        return dict(credentials)
+    
     def get_aws_credentials(self) -> Dict[str, Any]:
         """
         Get AWS credentials and configuration
@@ -35,12 +368,16 @@ class CredentialManager:
         Returns:
             AWS credentials dictionary
         """
+        return self._cached_credentials('aws', self._build_aws_credentials)
+    
+    def _build_aws_credentials(self) -> Dict[str, Any]:
+        """Resolve AWS credentials from config and environment"""
         aws_config = self.credentials.get('aws', {})
         
         # Merge with environment variables
         credentials = {
-            'profile': aws_config.get('profile', os.getenv('AWS_PROFILE', 'default')),
-            'region': aws_config.get('region', os.getenv('AWS_DEFAULT_REGION', 'us-east-1')),
+            'profile': _lookup(aws_config, 'profile', 'AWS_PROFILE', 'default'),
+            'region': _lookup(aws_config, 'region', 'AWS_DEFAULT_REGION', 'us-east-1'),
             'access_key_id': os.getenv('AWS_ACCESS_KEY_ID'),
             'secret_access_key': os.getenv('AWS_SECRET_ACCESS_KEY'),
             'session_token': os.getenv('AWS_SESSION_TOKEN')
@@ -56,37 +393,37 @@ class CredentialManager:
         Returns:
             Azure credentials dictionary
         """
+        return self._cached_credentials('azure', self._build_azure_credentials)
+    
+    def _build_azure_credentials(self) -> Dict[str, Any]:
+        """Resolve Azure credentials from config, environment and the Azure CLI"""
         azure_config = self.credentials.get('azure', {})
         
         # Try to get from config/env first
-        subscription_id = azure_config.get('subscription_id', os.getenv('AZURE_SUBSCRIPTION_ID'))
-        tenant_id = azure_config.get('tenant_id', os.getenv('AZURE_TENANT_ID'))
+        subscription_id = _lookup(azure_config, 'subscription_id', 'AZURE_SUBSCRIPTION_ID')
+        tenant_id = _lookup(azure_config, 'tenant_id', 'AZURE_TENANT_ID')
         
         # If subscription_id or tenant_id not found, try Azure CLI
         if not subscription_id or not tenant_id:
             try:
-                import subprocess
-                import json
-                
-                result = subprocess.run(
-                    ['az', 'account', 'show', '--output', 'json'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                result = _azure_cli_account()
                 
                 if result.returncode == 0:
-                    account_info = json.loads(result.stdout)
+                    # Two IDs, one per line (whitespace split also accepts tabs)
+                    fields = result.stdout.split()
+                    if len(fields) != 2:
+                        raise ValueError(f"Unexpected az account show output: {result.stdout.strip()!r}")
+                    detected_subscription, detected_tenant = fields
                     if not subscription_id:
-                        subscription_id = account_info.get('id')
+                        subscription_id = detected_subscription
                         self.logger.info("Detected Azure subscription ID from Azure CLI")
                     if not tenant_id:
-                        tenant_id = account_info.get('tenantId')
+                        tenant_id = detected_tenant
                         self.logger.info("Detected Azure tenant ID from Azure CLI")
                 else:
                     self.logger.warning("Azure CLI not authenticated or available")
                     
-            except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError) as e:
+            except (subprocess.TimeoutExpired, FileNotFoundError, ValueError) as e:
                 self.logger.warning(f"Could not get Azure CLI credentials: {e}")
             except Exception as e:
                 self.logger.warning(f"Unexpected error getting Azure CLI credentials: {e}")
@@ -94,8 +431,8 @@ class CredentialManager:
         credentials = {
             'subscription_id': subscription_id,
             'tenant_id': tenant_id,
-            'client_id': azure_config.get('client_id', os.getenv('AZURE_CLIENT_ID')),
-            'client_secret': azure_config.get('client_secret', os.getenv('AZURE_CLIENT_SECRET')),
+            'client_id': _lookup(azure_config, 'client_id', 'AZURE_CLIENT_ID'),
+            'client_secret': _lookup(azure_config, 'client_secret', 'AZURE_CLIENT_SECRET'),
             'location': azure_config.get('location', 'East US')
         }
         
@@ -109,49 +446,46 @@ class CredentialManager:
         Returns:
             GCP credentials dictionary
         """
+        return self._cached_credentials('gcp', self._build_gcp_credentials)
+    
+    def _build_gcp_credentials(self) -> Dict[str, Any]:
+        """Resolve GCP credentials from config, environment and the gcloud CLI"""
         gcp_config = self.credentials.get('gcp', {})
         
         # Try to get from config/env first
-        project_id = gcp_config.get('project_id', os.getenv('GCP_PROJECT_ID'))
-        region = gcp_config.get('region', os.getenv('GCP_REGION', 'us-central1'))
+        project_id = _lookup(gcp_config, 'project_id', 'GCP_PROJECT_ID')
+        region = _lookup(gcp_config, 'region', 'GCP_REGION', 'us-central1')
         
         # Try to get user email from environment or gcloud CLI
-        user_email = gcp_config.get('user_email', os.getenv('GCP_USER_EMAIL'))
+        user_email = _lookup(gcp_config, 'user_email', 'GCP_USER_EMAIL')
         
         # If project_id or user_email not found, try gcloud CLI
         if not project_id or not user_email:
             try:
-                import subprocess
+                # Read project and account with one gcloud call
+                core = _gcloud_core_config()
+                if core is None:
+                    # Unparseable output: query the missing values one at a time
+                    core = {}
+                    for key, value in (('project', project_id), ('account', user_email)):
+                        if not value:
+                            result = _gcloud_config(key)
+                            if result.returncode == 0:
+                                core[key] = result.stdout.strip()
                 
                 # Get project ID if not set
                 if not project_id:
-                    result = subprocess.run(
-                        ['gcloud', 'config', 'get-value', 'project'],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    
-                    if result.returncode == 0:
-                        detected_project = result.stdout.strip()
-                        if detected_project and detected_project != '(unset)':
-                            project_id = detected_project
-                            self.logger.info("Detected GCP project ID from gcloud CLI")
+                    detected_project = core.get('project')
+                    if detected_project and detected_project != '(unset)':
+                        project_id = detected_project
+                        self.logger.info("Detected GCP project ID from gcloud CLI")
                 
                 # Get user email if not set
                 if not user_email:
-                    result = subprocess.run(
-                        ['gcloud', 'config', 'get-value', 'account'],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    
-                    if result.returncode == 0:
-                        detected_email = result.stdout.strip()
-                        if detected_email and detected_email != '(unset)':
-                            user_email = detected_email
-                            self.logger.info("Detected GCP user email from gcloud CLI")
+                    detected_email = core.get('account')
+                    if detected_email and detected_email != '(unset)':
+                        user_email = detected_email
+                        self.logger.info("Detected GCP user email from gcloud CLI")
                 
                 if not project_id and not user_email:
                     self.logger.warning("gcloud CLI not configured or authenticated")
@@ -165,7 +499,7 @@ class CredentialManager:
             'project_id': project_id,
             'region': region,
             'user_email': user_email,
-            'credentials_file': gcp_config.get('credentials_file', os.getenv('GOOGLE_APPLICATION_CREDENTIALS'))
+            'credentials_file': _lookup(gcp_config, 'credentials_file', 'GOOGLE_APPLICATION_CREDENTIALS')
         }
         
         return {k: v for k, v in credentials.items() if v is not None}
@@ -221,6 +555,23 @@ class CredentialManager:
         
         return len(missing) == 0, missing
     
+    def environment_dependencies(self, provider: str,
+                                 challenge_variables: Dict[str, Any] = None) -> Tuple[str, ...]:
+        """
+        Get the environment variables setup_environment_variables() reads
+        
+        Args:
+            provider: Cloud provider name
+            challenge_variables: Additional variables from challenge config
+            
+        Returns:
+            Tuple of environment variable names (credentials, then ${VAR} references)
+        """
+        referenced = tuple(match.group(1) for match in
+                           (_REF_RE.fullmatch(v) for v in (challenge_variables or {}).values()
+                            if isinstance(v, str)) if match)
+        return self._CREDENTIAL_ENV_VARS.get(provider, ()) + referenced
+    
     def setup_environment_variables(self, provider: str, challenge_variables: Dict[str, Any] = None) -> Dict[str, str]:
         """
         Setup environment variables for Terraform execution
@@ -234,49 +585,23 @@ class CredentialManager:
         """
         env_vars = {}
         
-        if provider == 'aws':
-            aws_creds = self.get_aws_credentials()
-            if aws_creds.get('profile'):
-                env_vars['AWS_PROFILE'] = aws_creds['profile']
-            if aws_creds.get('region'):
-                env_vars['AWS_DEFAULT_REGION'] = aws_creds['region']
-            if aws_creds.get('access_key_id'):
-                env_vars['AWS_ACCESS_KEY_ID'] = aws_creds['access_key_id']
-            if aws_creds.get('secret_access_key'):
-                env_vars['AWS_SECRET_ACCESS_KEY'] = aws_creds['secret_access_key']
-            if aws_creds.get('session_token'):
-                env_vars['AWS_SESSION_TOKEN'] = aws_creds['session_token']
-        
-        elif provider == 'azure':
-            azure_creds = self.get_azure_credentials()
-            if azure_creds.get('subscription_id'):
-                env_vars['AZURE_SUBSCRIPTION_ID'] = azure_creds['subscription_id']
-            if azure_creds.get('tenant_id'):
-                env_vars['AZURE_TENANT_ID'] = azure_creds['tenant_id']
-            if azure_creds.get('client_id'):
-                env_vars['AZURE_CLIENT_ID'] = azure_creds['client_id']
-            if azure_creds.get('client_secret'):
-                env_vars['AZURE_CLIENT_SECRET'] = azure_creds['client_secret']
-        
-        elif provider == 'gcp':
-            gcp_creds = self.get_gcp_credentials()
-            if gcp_creds.get('project_id'):
-                env_vars['GCP_PROJECT_ID'] = gcp_creds['project_id']
-            if gcp_creds.get('region'):
-                env_vars['GCP_REGION'] = gcp_creds['region']
-            if gcp_creds.get('user_email'):
-                env_vars['GCP_USER_EMAIL'] = gcp_creds['user_email']
-            if gcp_creds.get('credentials_file'):
-                env_vars['GOOGLE_APPLICATION_CREDENTIALS'] = gcp_creds['credentials_file']
+        if provider in self._ENV_MAP:
+            creds = self.get_provider_credentials(provider)
+            for cred_key, env_var in self._ENV_MAP[provider]:
+                value = creds.get(cred_key)
+                if value:
+                    env_vars[env_var] = value
         
         # Add challenge-specific variables
         if challenge_variables:
+            environ = os.environ
             for key, value in challenge_variables.items():
-                if isinstance(value, str) and value.startswith('${') and value.endswith('}'):
+                match = _REF_RE.fullmatch(value) if isinstance(value, str) else None
+                if match:
                     # Environment variable reference
-                    env_var = value[2:-1]
-                    if env_var in os.environ:
-                        env_vars[f"TF_VAR_{key}"] = os.environ[env_var]
+                    env_value = environ.get(match.group(1))
+                    if env_value is not None:
+                        env_vars[f"TF_VAR_{key}"] = env_value
                 else:
                     env_vars[f"TF_VAR_{key}"] = str(value)
         
@@ -289,17 +614,8 @@ class CredentialManager:
         Returns:
             Tuple of (is_installed, version_string)
         """
-        try:
-            import subprocess
-            result = subprocess.run(['terraform', 'version'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version_line = result.stdout.split('\n')[0]
-                return True, version_line
-            else:
-                return False, None
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-            return False, None
+        # The installed Terraform does not change during a run
+        return _terraform_version()
     
     def validate_environment(self, provider: str) -> Dict[str, Any]:
         """
@@ -320,13 +636,15 @@ class CredentialManager:
             'environment_ready': False
         }
         
-        # Check Terraform
-        tf_installed, tf_version = self.check_terraform_installation()
+        # Check Terraform in the background while credentials (which may
+        # shell out to az/gcloud) are resolved on this thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            tf_future = executor.submit(self.check_terraform_installation)
+            creds_valid, missing_creds = self.validate_provider_credentials(provider)
+            tf_installed, tf_version = tf_future.result()
+        
         results['terraform_installed'] = tf_installed
         results['terraform_version'] = tf_version
-        
-        # Check credentials
-        creds_valid, missing_creds = self.validate_provider_credentials(provider)
         results['credentials_valid'] = creds_valid
         results['missing_credentials'] = missing_creds
         
@@ -2,10 +2,40 @@
 Logging configuration for CTF Manager
 """
 
+import atexit
+import io
 import logging
 import os
+import queue
+import re
 from datetime import datetime
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Dict, Iterable
+
+
+# Background listeners writing queued file records, by logger name
+_queue_listeners: Dict[str, QueueListener] = {}
+
+
+def _close_listener(listener: QueueListener):
+    """Stop a listener and flush/close its handlers and their file targets"""
+    listener.stop()
+    for handler in listener.handlers:
+        # MemoryHandler.close() flushes, then drops its target
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+
+
+def _stop_queue_listeners():
+    """Flush and stop all file-writing listeners (registered with atexit)"""
+    for name in list(_queue_listeners):
+        _close_listener(_queue_listeners.pop(name))
+
+
+atexit.register(_stop_queue_listeners)
 
 
 def setup_logger(name: str = "ctf-manager", log_level: str = "INFO", log_dir: str = "logs") -> logging.Logger:
@@ -40,14 +70,35 @@ def setup_logger(name: str = "ctf-manager", log_level: str = "INFO", log_dir: st
         datefmt='%H:%M:%S'
     )
     
-    # File handler
+    # File handler, fed through a queue so callers never block on disk writes.
+    # The file is only opened once something is written, and records are
+    # batched before hitting disk (errors are written through immediately)
     log_file = log_path / f"{name}.log"
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=10 * 1024 * 1024,
+        backupCount=3,
+        encoding='utf-8',
+        delay=True
+    )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    buffered_handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+    buffered_handler.setLevel(logging.DEBUG)
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(logging.DEBUG)
+    logger.addHandler(queue_handler)
     
-    # Console handler
+    previous = _queue_listeners.pop(name, None)
+    if previous:
+        _close_listener(previous)
+    listener = QueueListener(log_queue, buffered_handler, respect_handler_level=True)
+    listener.start()
+    _queue_listeners[name] = listener
+    
+    # Console handler (synchronous, so log lines stay in order with printed output)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, log_level.upper()))
     console_handler.setFormatter(console_formatter)
@@ -82,32 +133,48 @@ class TerraformLogFilter:
             ("Plan:", logging.INFO),
             ("Refreshing state...", logging.DEBUG)
         ]
+        # One lookahead per pattern, tried in list order, so the first listed
+        # pattern found anywhere in the line wins (as with a sequential scan)
+        self._pattern_re = re.compile(
+            '|'.join(f'(?=.*?({re.escape(pattern)}))' for pattern, _ in self.terraform_patterns),
+            re.IGNORECASE
+        )
+        self._pattern_levels = [level for _, level in self.terraform_patterns]
+        # Levels for the stable "<Word>:" prefixes Terraform starts lines with
+        self._prefix_levels = {
+            pattern: level for pattern, level in self.terraform_patterns
+            if pattern.endswith(':')
+        }
     
     def log_terraform_output(self, output: str):
         """Parse and log Terraform output with appropriate log levels"""
-        lines = output.split('\n')
-        
+        self.log_terraform_stream(io.StringIO(output))
+    
+    def log_terraform_stream(self, lines: Iterable[str]):
+        """Log Terraform output as it is produced (e.g. a process stdout pipe)"""
         for line in lines:
             line = line.strip()
             if not line:
                 continue
                 
-            # Determine log level based on content
-            log_level = logging.INFO
-            for pattern, level in self.terraform_patterns:
-                if pattern.lower() in line.lower():
-                    log_level = level
-                    break
+            # Determine log level from the line prefix (diagnostics may be boxed,
+            # "│ Error: ..."), falling back to a search of the whole line
+            head = line[1:].lstrip() if line.startswith('│') else line
+            prefix, sep, _ = head.partition(':')
+            log_level = self._prefix_levels.get(prefix + sep) if sep else None
+            if log_level is None:
+                match = self._pattern_re.match(line)
+                log_level = self._pattern_levels[match.lastindex - 1] if match else logging.INFO
             
-            # Log with appropriate level
-            self.logger.log(log_level, f"[TERRAFORM] {line}")
+            # Log with appropriate level (formatted only if the record is emitted)
+            self.logger.log(log_level, "[TERRAFORM] %s", line)
     
     def log_command(self, command: str, working_dir: str):
         """Log executed Terraform commands"""
-        self.logger.info(f"[TERRAFORM] Executing: {command}")
-        self.logger.debug(f"[TERRAFORM] Working directory: {working_dir}")
+        self.logger.info("[TERRAFORM] Executing: %s", command)
+        self.logger.debug("[TERRAFORM] Working directory: %s", working_dir)
     
     def log_result(self, command: str, success: bool, duration: float):
         """Log command execution results"""
         status = "SUCCESS" if success else "FAILED"
-        self.logger.info(f"[TERRAFORM] Command '{command}' {status} in {duration:.2f}s")
+        self.logger.info("[TERRAFORM] Command '%s' %s in %.2fs", command, status, duration)
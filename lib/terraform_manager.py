@@ -4,15 +4,109 @@ Handles Terraform operations: init, plan, apply, destroy, output
 """
 
 import os
+import json
+import hashlib
+import logging
 import subprocess
+import threading
 import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
-from .challenge import Challenge, ChallengeStatus
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from .challenge import Challenge, ChallengeStatus, load_state, STATUS_CACHE_TTL
 from .credential_manager import CredentialManager
 from .logger import get_logger, TerraformLogFilter
 
 
+# Default Terraform -parallelism: runs wait on cloud APIs, so go well past the
+# core count (but never below Terraform's own default of 10)
+DEFAULT_PARALLELISM = max(10, (os.cpu_count() or 1) * 3)
+
+# Upper bound on the default per provider, to stay clear of API rate limiting
+PROVIDER_PARALLELISM_CAPS = {
+    'aws': 32,
+    'azure': 16,
+    'gcp': 24
+}
+
+# Terraform processes the *_async methods keep in flight at once
+MAX_CONCURRENT_RUNS = 4
+
+# Written into .terraform after a successful init; holds the hash of its inputs
+INIT_MARKER = '.hackthecloud_backend_hash'
+
+
+def _state_resource_addresses(state: Dict[str, Any]) -> List[str]:
+    """Build resource instance addresses from state, as 'terraform state list' prints them"""
+    addresses = []
+    for resource in state.get('resources') or []:
+        address = f"{resource.get('type')}.{resource.get('name')}"
+        if resource.get('mode') == 'data':
+            address = f"data.{address}"
+        if resource.get('module'):
+            address = f"{resource['module']}.{address}"
+        
+        for instance in resource.get('instances') or [{}]:
+            index_key = instance.get('index_key')
+            if index_key is None:
+                addresses.append(address)
+            else:
+                addresses.append(f"{address}[{json.dumps(index_key)}]")
+    return addresses
+
+
+def _show_resource_addresses(module: Dict[str, Any]) -> List[str]:
+    """Collect resource addresses from a 'terraform show -json' module, including child modules"""
+    addresses = [resource.get('address') for resource in module.get('resources') or []]
+    for child in module.get('child_modules') or []:
+        addresses.extend(_show_resource_addresses(child))
+    return addresses
+
+
+def _fast_rmtree(path: Path, max_workers: int = 8) -> None:
+    """
+    Remove a directory tree, unlinking its files from a thread pool
+    
+    Symlinks (such as providers linked from the shared plugin cache) are
+    removed themselves, never followed. With a single CPU the files are
+    unlinked inline, as the pool only adds overhead there.
+    
+    Args:
+        path: Directory to remove
+        max_workers: Upper bound on concurrent unlink workers
+    """
+    if os.path.islink(path):
+        os.unlink(path)
+        return
+    
+    workers = min(max_workers, os.cpu_count() or 1)
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    directories = []
+    pending = [os.fspath(path)]
+    try:
+        unlinks = []
+        while pending:
+            directory = pending.pop()
+            directories.append(directory)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif executor:
+                        unlinks.append(executor.submit(os.unlink, entry.path))
+                    else:
+                        os.unlink(entry.path)
+        for unlink in unlinks:
+            unlink.result()
+    finally:
+        if executor:
+            executor.shutdown()
+    
+    # Every directory was listed after its parent, so children go first
+    for directory in reversed(directories):
+        os.rmdir(directory)
+
+
 class TerraformManager:
     """Manages Terraform operations for CTF challenges"""
     
@@ -21,9 +115,95 @@ class TerraformManager:
         self.logger = get_logger()
         self.tf_logger = TerraformLogFilter(self.logger)
         
+        # Provider/challenge environment variables by their inputs (see _build_env)
+        self._env_cache: Dict[Tuple, Dict[str, str]] = {}
+        
+        # Parsed remote-backend outputs: (directory, format) -> (state fingerprint, time, outputs)
+        self._outputs_cache: Dict[Tuple[str, str], Tuple[Tuple[str, int], float, Dict[str, Any]]] = {}
+        self._outputs_lock = threading.Lock()
+        
+        # Futures of read operations in progress, so identical concurrent calls share one run
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Bounds concurrent *_async runs; asyncio semaphores belong to one event loop
+        self._semaphore = None
+        self._semaphore_loop = None
+        
+        # Background 'terraform init' runs by challenge name (see prewarm)
+        self._init_futures: Dict[str, Future] = {}
+        self._init_lock = threading.Lock()
+        self._prewarm_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Held around 'terraform init': the shared plugin cache is not safe for concurrent use
+        self._plugin_cache_lock = threading.Lock()
+    
+    def _load_local_state(self, challenge: Challenge) -> Optional[Dict[str, Any]]:
+        """
+        Read a challenge's state directly when it uses the local backend
+        
+        Args:
+            challenge: Challenge instance
+            
+        Returns:
+            Parsed state ({} if no resources were ever applied), or None when the
+            state lives in a remote backend or cannot be read locally
+        """
+        if challenge.get_backend_type() != 'local':
+            return None
+        
+        try:
+            return load_state(challenge.state_file) or {}
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Could not read local state for {challenge.name}: {e}")
+            return None
+    
+    def _build_env(self, challenge: Challenge) -> Dict[str, str]:
+        """
+        Get the credential and TF_VAR_* environment variables for a challenge
+        
+        Results are reused while the challenge variables and the environment
+        variables they are derived from (credentials, ${VAR} references) are unchanged.
+        
+        Args:
+            challenge: Challenge instance
+            
+        Returns:
+            Copy of the environment variables to pass to Terraform
+        """
+        variables = challenge.variables or {}
+        env_names = self.credential_manager.environment_dependencies(challenge.provider, variables)
+        key = (
+            challenge.provider,
+            tuple((name, repr(value)) for name, value in variables.items()),
+            tuple(os.environ.get(name) for name in env_names)
+        )
+        
+        env_vars = self._env_cache.get(key)
+        if env_vars is None:
+            env_vars = self._env_cache[key] = self.credential_manager.setup_environment_variables(
+                challenge.provider, challenge.variables
+            )
+        return dict(env_vars)
+    
+    def _parallelism(self, challenge: Challenge, parallelism: Optional[int]) -> int:
+        """
+        Resolve the -parallelism value for a Terraform run
+        
+        Args:
+            challenge: Challenge instance
+            parallelism: Requested value; None for the provider-capped default
+            
+        Returns:
+            Concurrent resource operations to pass to Terraform
+        """
+        if parallelism:
+            return parallelism
+        return min(DEFAULT_PARALLELISM, PROVIDER_PARALLELISM_CAPS.get(challenge.provider, DEFAULT_PARALLELISM))
+        
     def _run_terraform_command(self, command: List[str], working_dir: Path, 
                               env_vars: Dict[str, str] = None, 
-                              timeout: int = 600) -> Tuple[bool, str, str]:
+                              timeout: int = 600, log_stdout: bool = True) -> Tuple[bool, str, str]:
         """
         Execute a Terraform command
         
@@ -32,6 +212,8 @@ class TerraformManager:
             working_dir: Working directory for command execution
             env_vars: Additional environment variables
             timeout: Command timeout in seconds
+            log_stdout: Log stdout lines; False for JSON queries whose output
+                may hold sensitive values (only its size is logged, at DEBUG)
             
         Returns:
             Tuple of (success, stdout, stderr)
@@ -41,11 +223,13 @@ class TerraformManager:
         if env_vars:
             env.update(env_vars)
         
-        # Log command execution
-        cmd_str = ' '.join(command)
-        self.tf_logger.log_command(cmd_str, str(working_dir))
+        # Log command execution (skipped, with its string building, when INFO is off)
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        cmd_str = ' '.join(command) if log_info else ''
+        if log_info:
+            self.tf_logger.log_command(cmd_str, str(working_dir))
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # For interactive commands, don't capture stdin
@@ -62,42 +246,151 @@ class TerraformManager:
                 success = result.returncode == 0
                 return success, "", ""
             else:
-                # Non-interactive mode - capture output
-                result = subprocess.run(
+                # Non-interactive mode - capture output, logging it as it arrives
+                process = subprocess.Popen(
                     command,
                     cwd=working_dir,
                     env=env,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True
                 )
+                stdout_lines, stderr_lines = [], []
+                stdout_drain = self._drain_output if log_stdout else self._capture_output
+                drains = [
+                    threading.Thread(target=stdout_drain, args=(process.stdout, stdout_lines), daemon=True),
+                    threading.Thread(target=self._drain_output, args=(process.stderr, stderr_lines), daemon=True)
+                ]
+                for drain in drains:
+                    drain.start()
+                
+                try:
+                    returncode = process.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                    # Leftover grandchildren may still hold the pipes open
+                    for drain in drains:
+                        drain.join(5)
+                    raise
+                for drain in drains:
+                    drain.join()
             
-            duration = time.time() - start_time
-            success = result.returncode == 0
-            
-            # Log output
-            if result.stdout:
-                self.tf_logger.log_terraform_output(result.stdout)
-            if result.stderr:
-                self.tf_logger.log_terraform_output(result.stderr)
+            success = returncode == 0
+            if not log_stdout:
+                self.logger.debug("Captured %d bytes of output from %s",
+                                  sum(map(len, stdout_lines)), command[1])
             
             # Log result
-            self.tf_logger.log_result(cmd_str, success, duration)
+            if log_info:
+                self.tf_logger.log_result(cmd_str, success, time.monotonic() - start_time)
             
-            return success, result.stdout, result.stderr
+            return success, ''.join(stdout_lines), ''.join(stderr_lines)
             
         except subprocess.TimeoutExpired:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
+            cmd_str = cmd_str or ' '.join(command)
             self.logger.error(f"Terraform command timed out after {timeout}s: {cmd_str}")
             self.tf_logger.log_result(cmd_str, False, duration)
             return False, "", f"Command timed out after {timeout}s"
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
+            cmd_str = cmd_str or ' '.join(command)
             self.logger.error(f"Error executing terraform command: {e}")
             self.tf_logger.log_result(cmd_str, False, duration)
             return False, "", str(e)
     
+    def _drain_output(self, stream, lines: List[str]) -> None:
+        """
+        Log a process output stream line by line, keeping a copy for the caller
+        
+        Args:
+            stream: Text pipe of a running process
+            lines: List the lines are appended to
+        """
+        def collect():
+            for line in stream:
+                lines.append(line)
+                yield line
+        
+        with stream:
+            self.tf_logger.log_terraform_stream(collect())
+    
+    def _capture_output(self, stream, lines: List[str]) -> None:
+        """
+        Read a process output stream without logging it
+        
+        Args:
+            stream: Text pipe of a running process
+            lines: List the output is appended to
+        """
+        with stream:
+            lines.append(stream.read())
+    
+    def prewarm(self, challenge: Challenge,
+                wait_for: Optional[Callable[[], None]] = None) -> Future:
+        """
+        Start 'terraform init' for a challenge in the background
+        
+        The next init() of the challenge returns this run's result instead of
+        initializing again, and plan/apply/destroy wait for it before starting.
+        Runs still queued are dropped by cancel_prewarm().
+        
+        Args:
+            challenge: Challenge instance
+            wait_for: Called in the worker before init, e.g. to let a provider warm-up finish
+            
+        Returns:
+            Future resolving to the init result
+        """
+        def run() -> bool:
+            if wait_for:
+                wait_for()
+            return self._init(challenge)
+        
+        with self._init_lock:
+            future = self._init_futures.get(challenge.name)
+            if future is None:
+                if self._prewarm_executor is None:
+                    # One worker: inits serialize on the plugin cache anyway, and queued
+                    # runs stay cancellable
+                    self._prewarm_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix='terraform-prewarm'
+                    )
+                future = self._prewarm_executor.submit(run)
+                self._init_futures[challenge.name] = future
+        return future
+    
+    def _take_prewarm(self, challenge: Challenge) -> Optional[bool]:
+        """
+        Wait for and consume a background init of a challenge
+        
+        Returns:
+            The background init's result, or None if none was started
+        """
+        with self._init_lock:
+            future = self._init_futures.pop(challenge.name, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except CancelledError:
+            return None
+    
+    def cancel_prewarm(self) -> None:
+        """
+        Drop background inits that have not started yet
+        
+        Runs already in progress finish on their own; the affected challenges
+        fall back to a regular init.
+        """
+        with self._init_lock:
+            executor, self._prewarm_executor = self._prewarm_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def init(self, challenge: Challenge, force_reconfigure: bool = False) -> bool:
         """
         Initialize Terraform for a challenge
@@ -109,40 +402,102 @@ class TerraformManager:
         Returns:
             True if successful, False otherwise
         """
+        prewarmed = self._take_prewarm(challenge)
+        if prewarmed is not None and not force_reconfigure:
+            return prewarmed
+        return self._init(challenge, force_reconfigure)
+    
+    def _init_hash(self, challenge: Challenge) -> Optional[str]:
+        """
+        Hash what 'terraform init' depends on: the backend config, the lock file
+        and the configuration files (generated .tfvars are left out)
+        
+        Returns:
+            Hex digest, or None if any of the files cannot be read
+        """
+        paths = [challenge.full_backend_config_path, challenge.lock_file]
+        paths.extend(path for path in challenge.get_terraform_files()
+                     if path.suffix != '.tfvars')
+        
+        digest = hashlib.blake2b()
+        try:
+            for path in paths:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                digest.update(f'{path.name}:{len(data)}:'.encode())
+                digest.update(data)
+        except OSError:
+            return None
+        return digest.hexdigest()
+    
+    def _init(self, challenge: Challenge, force_reconfigure: bool = False) -> bool:
+        """Run 'terraform init' for a challenge (see init)"""
         if not challenge.full_directory_path or not challenge.full_backend_config_path:
             self.logger.error(f"Invalid paths for challenge {challenge.name}")
             return False
         
+        # Already initialized from these exact inputs: skip the backend handshake
+        marker = challenge.terraform_dir / INIT_MARKER
+        expected = self._init_hash(challenge)
+        if not force_reconfigure and expected is not None:
+            try:
+                if marker.read_text() == expected:
+                    self.logger.info(f"Terraform already initialized for {challenge.name}")
+                    return True
+            except OSError:
+                pass
+        
         # Setup environment variables
-        env_vars = self.credential_manager.setup_environment_variables(
-            challenge.provider, challenge.variables
-        )
+        env_vars = self._build_env(challenge)
+        
+        # Share provider plugins between challenges: the first init downloads them,
+        # later ones link from the cache (a user-provided cache dir is respected)
+        if 'TF_PLUGIN_CACHE_DIR' not in os.environ:
+            plugin_cache_dir = challenge.base_path / '.terraform-plugin-cache'
+            plugin_cache_dir.mkdir(exist_ok=True)
+            env_vars['TF_PLUGIN_CACHE_DIR'] = str(plugin_cache_dir)
+        # Use cached plugins even when no lock file records their checksums yet
+        if 'TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE' not in os.environ:
+            env_vars['TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE'] = '1'
         
         # Build command
-        command = ['terraform', 'init', f'-backend-config={challenge.full_backend_config_path}']
+        command = ['terraform', 'init', '-input=false',
+                   f'-backend-config={challenge.full_backend_config_path}']
         
         if force_reconfigure:
             command.append('-reconfigure')
         
-        success, stdout, stderr = self._run_terraform_command(
-            command, challenge.full_directory_path, env_vars
-        )
+        with self._plugin_cache_lock:
+            success, stdout, stderr = self._run_terraform_command(
+                command, challenge.full_directory_path, env_vars
+            )
         
         if success:
             self.logger.info(f"Terraform init successful for {challenge.name}")
+            # Init may have created or updated the lock file, so hash afterwards
+            initialized = self._init_hash(challenge)
+            try:
+                if initialized is not None:
+                    marker.write_text(initialized)
+            except OSError as e:
+                self.logger.debug(f"Could not record init hash for {challenge.name}: {e}")
         else:
             self.logger.error(f"Terraform init failed for {challenge.name}")
             self.logger.error(f"Error: {stderr}")
         
         return success
     
-    def plan(self, challenge: Challenge, var_file: bool = True) -> Tuple[bool, str]:
+    def plan(self, challenge: Challenge, var_file: bool = True,
+            parallelism: Optional[int] = None, refresh: bool = True) -> Tuple[bool, str]:
         """
         Run Terraform plan for a challenge
         
         Args:
             challenge: Challenge instance
             var_file: Whether to use terraform.tfvars file
+            parallelism: Concurrent resource operations (provider-capped default if None)
+            refresh: Refresh state from the provider first; pass False when the
+                state is known to be current (e.g. right after an apply)
             
         Returns:
             Tuple of (success, plan_output)
@@ -151,23 +506,31 @@ class TerraformManager:
             self.logger.error(f"Invalid directory path for challenge {challenge.name}")
             return False, ""
         
+        # Let a background init of the working directory finish first
+        self._take_prewarm(challenge)
+        
         # Create variables file if requested
+        tfvars_file = None
         if var_file:
             try:
-                challenge.create_terraform_variables_file()
+                tfvars_file = challenge.create_terraform_variables_file()
             except Exception as e:
                 self.logger.warning(f"Could not create variables file: {e}")
         
         # Setup environment variables
-        env_vars = self.credential_manager.setup_environment_variables(
-            challenge.provider, challenge.variables
-        )
+        env_vars = self._build_env(challenge)
         
         # Build command
         command = ['terraform', 'plan']
+        command.append(f'-parallelism={self._parallelism(challenge, parallelism)}')
+        if not refresh:
+            command.append('-refresh=false')
         if var_file:
-            tfvars_file = challenge.full_directory_path / "terraform.tfvars"
-            if tfvars_file.exists():
+            # A freshly written file is known to exist; otherwise look for a stale one
+            if tfvars_file is None:
+                candidate = challenge.tfvars_path
+                tfvars_file = candidate if candidate.exists() else None
+            if tfvars_file is not None:
                 command.extend(['-var-file', str(tfvars_file)])
         
         success, stdout, stderr = self._run_terraform_command(
@@ -183,7 +546,8 @@ class TerraformManager:
         return success, stdout
     
     def apply(self, challenge: Challenge, auto_approve: bool = False, 
-             var_file: bool = True) -> bool:
+             var_file: bool = True, parallelism: Optional[int] = None,
+             refresh: bool = True) -> bool:
         """
         Apply Terraform configuration for a challenge
         
@@ -191,6 +555,9 @@ class TerraformManager:
             challenge: Challenge instance
             auto_approve: Skip confirmation prompt
             var_file: Whether to use terraform.tfvars file
+            parallelism: Concurrent resource operations (provider-capped default if None)
+            refresh: Refresh state from the provider first; pass False when the
+                state is known to be current (e.g. right after a plan)
             
         Returns:
             True if successful, False otherwise
@@ -199,31 +566,41 @@ class TerraformManager:
             self.logger.error(f"Invalid directory path for challenge {challenge.name}")
             return False
         
+        # Let a background init of the working directory finish first
+        self._take_prewarm(challenge)
+        
         # Create variables file if requested
+        tfvars_file = None
         if var_file:
             try:
-                challenge.create_terraform_variables_file()
+                tfvars_file = challenge.create_terraform_variables_file()
             except Exception as e:
                 self.logger.warning(f"Could not create variables file: {e}")
         
         # Setup environment variables
-        env_vars = self.credential_manager.setup_environment_variables(
-            challenge.provider, challenge.variables
-        )
+        env_vars = self._build_env(challenge)
         
         # Build command
         command = ['terraform', 'apply']
         if auto_approve:
             command.append('-auto-approve')
+        command.append(f'-parallelism={self._parallelism(challenge, parallelism)}')
+        if not refresh:
+            command.append('-refresh=false')
         if var_file:
-            tfvars_file = challenge.full_directory_path / "terraform.tfvars"
-            if tfvars_file.exists():
+            # A freshly written file is known to exist; otherwise look for a stale one
+            if tfvars_file is None:
+                candidate = challenge.tfvars_path
+                tfvars_file = candidate if candidate.exists() else None
+            if tfvars_file is not None:
                 command.extend(['-var-file', str(tfvars_file)])
         
         success, stdout, stderr = self._run_terraform_command(
             command, challenge.full_directory_path, env_vars, 
             timeout=2400 if challenge.name == 'challenge-04-aws-only' else 1200  # 40 min for Windows DC, 20 min for others
         )
+        # Even a failed run may have changed some resources
+        self.invalidate_outputs(challenge)
         
         if success:
             self.logger.info(f"Terraform apply successful for {challenge.name}")
@@ -234,7 +611,7 @@ class TerraformManager:
         return success
     
     def destroy(self, challenge: Challenge, auto_approve: bool = False,
-               var_file: bool = True) -> bool:
+               var_file: bool = True, parallelism: Optional[int] = None) -> bool:
         """
         Destroy Terraform resources for a challenge
         
@@ -242,6 +619,7 @@ class TerraformManager:
             challenge: Challenge instance
             auto_approve: Skip confirmation prompt
             var_file: Whether to use terraform.tfvars file
+            parallelism: Concurrent resource operations (provider-capped default if None)
             
         Returns:
             True if successful, False otherwise
@@ -250,17 +628,19 @@ class TerraformManager:
             self.logger.error(f"Invalid directory path for challenge {challenge.name}")
             return False
         
+        # Let a background init of the working directory finish first
+        self._take_prewarm(challenge)
+        
         # Setup environment variables
-        env_vars = self.credential_manager.setup_environment_variables(
-            challenge.provider, challenge.variables
-        )
+        env_vars = self._build_env(challenge)
         
         # Build command
         command = ['terraform', 'destroy']
         if auto_approve:
             command.append('-auto-approve')
+        command.append(f'-parallelism={self._parallelism(challenge, parallelism)}')
         if var_file:
-            tfvars_file = challenge.full_directory_path / "terraform.tfvars"
+            tfvars_file = challenge.tfvars_path
             if tfvars_file.exists():
                 command.extend(['-var-file', str(tfvars_file)])
         
@@ -268,6 +648,8 @@ class TerraformManager:
             command, challenge.full_directory_path, env_vars, 
             timeout=2400 if challenge.name == 'challenge-04-aws-only' else 1200  # 40 min for Windows DC, 20 min for others
         )
+        # Even a failed run may have changed some resources
+        self.invalidate_outputs(challenge)
         
         if success:
             self.logger.info(f"Terraform destroy successful for {challenge.name}")
@@ -277,10 +659,47 @@ class TerraformManager:
         
         return success
     
+    def _coalesced(self, key: Tuple, work: Callable[[], Any]) -> Any:
+        """
+        Run an operation once for concurrent identical calls
+        
+        The first caller for a key does the work; callers arriving while it is in
+        flight wait for, and share, its result (or exception).
+        
+        Args:
+            key: Operation name and arguments
+            work: Function doing the operation
+            
+        Returns:
+            The operation's result
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            result = work()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
     def get_outputs(self, challenge: Challenge, output_format: str = 'json') -> Tuple[bool, Dict[str, Any]]:
         """
         Get Terraform outputs for a challenge
         
+        Concurrent calls for the same challenge and format share one lookup.
+        
         Args:
             challenge: Challenge instance
             output_format: Output format (json, raw)
@@ -288,14 +707,35 @@ class TerraformManager:
         Returns:
             Tuple of (success, outputs_dict)
         """
+        success, outputs = self._coalesced(
+            ('get_outputs', str(challenge.full_directory_path), output_format),
+            lambda: self._get_outputs(challenge, output_format)
+        )
+        return success, dict(outputs)
+    
+    def _get_outputs(self, challenge: Challenge, output_format: str) -> Tuple[bool, Dict[str, Any]]:
+        """Look up Terraform outputs for a challenge (see get_outputs)"""
         if not challenge.full_directory_path:
             self.logger.error(f"Invalid directory path for challenge {challenge.name}")
             return False, {}
         
+        # Local state already holds the output values
+        if output_format == 'json':
+            state = self._load_local_state(challenge)
+            if state is not None:
+                return True, {k: v.get('value', v) for k, v in (state.get('outputs') or {}).items()}
+        
+        # Remote state cannot be watched locally, so reuse outputs for STATUS_CACHE_TTL
+        # seconds unless the local state markers changed (e.g. re-init)
+        cache_key = (str(challenge.full_directory_path), output_format)
+        fingerprint = challenge.state_fingerprint()
+        with self._outputs_lock:
+            cached = self._outputs_cache.get(cache_key)
+        if cached and cached[0] == fingerprint and time.monotonic() - cached[1] < STATUS_CACHE_TTL:
+            return True, dict(cached[2])
+        
         # Setup environment variables
-        env_vars = self.credential_manager.setup_environment_variables(
-            challenge.provider, challenge.variables
-        )
+        env_vars = self._build_env(challenge)
         
         # Build command
         command = ['terraform', 'output']
@@ -303,7 +743,8 @@ class TerraformManager:
             command.append('-json')
         
         success, stdout, stderr = self._run_terraform_command(
-            command, challenge.full_directory_path, env_vars
+            command, challenge.full_directory_path, env_vars,
+            log_stdout=output_format != 'json'
         )
         
         if not success:
@@ -312,19 +753,116 @@ class TerraformManager:
         
         if output_format == 'json' and stdout:
             try:
-                import json
                 outputs = json.loads(stdout)
                 # Terraform outputs have 'value' field, extract just the values
-                return True, {k: v.get('value', v) for k, v in outputs.items()}
+                outputs = {k: v.get('value', v) for k, v in outputs.items()}
             except json.JSONDecodeError as e:
                 self.logger.error(f"Failed to parse JSON outputs: {e}")
                 return False, {}
+        else:
+            outputs = {'raw_output': stdout}
+        
+        with self._outputs_lock:
+            self._outputs_cache[cache_key] = (fingerprint, time.monotonic(), outputs)
+        return True, dict(outputs)
+    
+    def _show_json(self, challenge: Challenge) -> Optional[Dict[str, Any]]:
+        """
+        Read state and outputs with a single 'terraform show -json'
+        
+        The parsed outputs also seed the get_outputs() cache.
+        
+        Args:
+            challenge: Challenge instance
+            
+        Returns:
+            Parsed show output ({'format_version': ...} only if the state is empty),
+            or None if the command failed
+        """
+        env_vars = self._build_env(challenge)
+        fingerprint = challenge.state_fingerprint()
         
-        return True, {'raw_output': stdout}
+        # State can hold generated passwords and keys: keep it out of the logs
+        success, stdout, stderr = self._run_terraform_command(
+            ['terraform', 'show', '-json'], challenge.full_directory_path, env_vars,
+            log_stdout=False
+        )
+        if not success:
+            self.logger.error(f"Failed to read state for {challenge.name}: {stderr}")
+            return None
+        
+        try:
+            show = json.loads(stdout) if stdout.strip() else {}
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse terraform show output: {e}")
+            return None
+        
+        outputs = (show.get('values') or {}).get('outputs') or {}
+        values = {k: v.get('value', v) for k, v in outputs.items()}
+        with self._outputs_lock:
+            self._outputs_cache[(str(challenge.full_directory_path), 'json')] = (
+                fingerprint, time.monotonic(), values
+            )
+        return show
+    
+    def invalidate_outputs(self, challenge: Challenge) -> None:
+        """Forget cached outputs for a challenge (done after every apply and destroy)"""
+        directory = str(challenge.full_directory_path)
+        with self._outputs_lock:
+            for key in [key for key in self._outputs_cache if key[0] == directory]:
+                del self._outputs_cache[key]
+    
+    async def _run_async(self, operation, *args, **kwargs):
+        """
+        Run a blocking Terraform operation in a worker thread, bounded by MAX_CONCURRENT_RUNS
+        
+        Args:
+            operation: Bound TerraformManager method
+            *args, **kwargs: Arguments for the operation
+            
+        Returns:
+            The operation's result
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+            self._semaphore_loop = loop
+        
+        async with self._semaphore:
+            return await asyncio.to_thread(operation, *args, **kwargs)
+    
+    async def init_async(self, challenge: Challenge, force_reconfigure: bool = False) -> bool:
+        """Async variant of init(), so several challenges can be initialized with asyncio.gather"""
+        return await self._run_async(self.init, challenge, force_reconfigure)
+    
+    async def plan_async(self, challenge: Challenge, var_file: bool = True,
+                         parallelism: Optional[int] = None, refresh: bool = True) -> Tuple[bool, str]:
+        """Async variant of plan()"""
+        return await self._run_async(self.plan, challenge, var_file, parallelism, refresh)
+    
+    async def apply_async(self, challenge: Challenge, auto_approve: bool = False,
+                          var_file: bool = True, parallelism: Optional[int] = None,
+                          refresh: bool = True) -> bool:
+        """Async variant of apply(); use auto_approve when running several at once"""
+        return await self._run_async(self.apply, challenge, auto_approve, var_file, parallelism, refresh)
+    
+    async def destroy_async(self, challenge: Challenge, auto_approve: bool = False,
+                            var_file: bool = True, parallelism: Optional[int] = None) -> bool:
+        """Async variant of destroy(); use auto_approve when running several at once"""
+        return await self._run_async(self.destroy, challenge, auto_approve, var_file, parallelism)
+    
+    async def get_outputs_async(self, challenge: Challenge,
+                                output_format: str = 'json') -> Tuple[bool, Dict[str, Any]]:
+        """Async variant of get_outputs()"""
+        return await self._run_async(self.get_outputs, challenge, output_format)
     
     def get_state_info(self, challenge: Challenge) -> Dict[str, Any]:
         """
-        Get Terraform state information using CLI commands
+        Get Terraform state information (from a local state file, or the CLI)
+        
+        Concurrent calls for the same challenge share one lookup.
         
         Args:
             challenge: Challenge instance
@@ -332,12 +870,18 @@ class TerraformManager:
         Returns:
             State information dictionary
         """
+        return dict(self._coalesced(
+            ('get_state_info', str(challenge.full_directory_path)),
+            lambda: self._get_state_info(challenge)
+        ))
+    
+    def _get_state_info(self, challenge: Challenge) -> Dict[str, Any]:
+        """Look up Terraform state information for a challenge (see get_state_info)"""
         if not challenge.full_directory_path:
             return {'error': 'Invalid directory path'}
         
         # Check if terraform is initialized
-        terraform_dir = challenge.full_directory_path / '.terraform'
-        if not terraform_dir.exists():
+        if not challenge.terraform_dir.exists():
             return {
                 'state_exists': False,
                 'terraform_initialized': False,
@@ -345,6 +889,18 @@ class TerraformManager:
                 'resource_count': 0
             }
         
+        # Local state is plain JSON: list its resources without starting Terraform
+        state = self._load_local_state(challenge)
+        if state is not None:
+            resource_lines = _state_resource_addresses(state)
+            return {
+                'state_exists': True,
+                'terraform_initialized': True,
+                'resources': [{'name': resource} for resource in resource_lines],
+                'resource_count': len(resource_lines),
+                'resource_list': resource_lines
+            }
+        
         try:
             # Get resource list using terraform state list
             result = subprocess.run(
@@ -405,17 +961,26 @@ class TerraformManager:
         
         # Check if Terraform is initialized
         if challenge.full_directory_path:
-            terraform_dir = challenge.full_directory_path / '.terraform'
-            results['terraform_initialized'] = terraform_dir.exists()
+            results['terraform_initialized'] = challenge.terraform_dir.exists()
         
-        # Check state
-        state_info = self.get_state_info(challenge)
-        results['state_exists'] = state_info.get('state_exists', False)
-        results['resources_deployed'] = state_info.get('resource_count', 0) > 0
+        # Check state, reading a local state file once for both resources and outputs
+        state = self._load_local_state(challenge)
+        if state is not None:
+            resource_count = len(_state_resource_addresses(state))
+            results['state_exists'] = bool(state)
+            results['outputs_available'] = bool(state.get('outputs'))
+        elif results['terraform_initialized']:
+            # Remote backend: one 'terraform show -json' covers both resources and outputs
+            show = self._show_json(challenge)
+            values = (show or {}).get('values') or {}
+            resource_count = len(_show_resource_addresses(values.get('root_module') or {}))
+            results['state_exists'] = show is not None
+            results['outputs_available'] = bool(values.get('outputs'))
+        else:
+            resource_count = 0
         
-        # Check outputs
-        outputs_success, outputs = self.get_outputs(challenge)
-        results['outputs_available'] = outputs_success and bool(outputs)
+        results['resource_count'] = resource_count
+        results['resources_deployed'] = resource_count > 0
         
         # Collect validation errors
         if not results['terraform_initialized']:
@@ -446,28 +1011,27 @@ class TerraformManager:
         
         try:
             # Remove .terraform directory
-            terraform_dir = challenge.full_directory_path / '.terraform'
+            terraform_dir = challenge.terraform_dir
             if terraform_dir.exists():
-                import shutil
-                shutil.rmtree(terraform_dir)
+                _fast_rmtree(terraform_dir)
                 self.logger.info(f"Removed .terraform directory for {challenge.name}")
             
             # Remove lock file
-            lock_file = challenge.full_directory_path / '.terraform.lock.hcl'
+            lock_file = challenge.lock_file
             if lock_file.exists():
                 lock_file.unlink()
                 self.logger.info(f"Removed .terraform.lock.hcl for {challenge.name}")
             
             # Remove generated tfvars
-            tfvars_file = challenge.full_directory_path / "terraform.tfvars"
+            tfvars_file = challenge.tfvars_path
             if tfvars_file.exists():
                 tfvars_file.unlink()
                 self.logger.info(f"Removed terraform.tfvars for {challenge.name}")
             
             # Remove state files if requested (dangerous!)
             if cleanup_state:
-                state_file = challenge.full_directory_path / "terraform.tfstate"
-                backup_file = challenge.full_directory_path / "terraform.tfstate.backup"
+                state_file = challenge.state_file
+                backup_file = challenge.backup_file
                 
                 if state_file.exists():
                     state_file.unlink()
@@ -0,0 +1,60 @@
+"""
+Tests for CredentialManager credential caching across CLI configuration changes
+"""
+
+import os
+import subprocess
+
+import pytest
+
+from lib import credential_manager
+from lib.credential_manager import CredentialManager
+
+
+class StubConfigLoader:
+    """Config loader without a credentials file"""
+
+    def load_credentials_config(self):
+        return {}
+
+
+@pytest.fixture
+def azure_cli(tmp_path, monkeypatch):
+    """Point the Azure CLI config at tmp_path and fake 'az account show'"""
+    profile = tmp_path / 'azureProfile.json'
+    profile.write_text('{}')
+    monkeypatch.setenv('AZURE_CONFIG_DIR', str(tmp_path))
+    monkeypatch.delenv('AZURE_SUBSCRIPTION_ID', raising=False)
+    monkeypatch.delenv('AZURE_TENANT_ID', raising=False)
+
+    account = {'subscription': 'sub-1'}
+
+    def fake_account():
+        return subprocess.CompletedProcess(
+            ['az'], 0, f"{account['subscription']}\ntenant-1\n", '')
+
+    monkeypatch.setattr(credential_manager, '_azure_cli_account', fake_account)
+    return profile, account
+
+
+def test_credentials_reused_while_cli_config_unchanged(azure_cli):
+    _, account = azure_cli
+    manager = CredentialManager(StubConfigLoader())
+
+    assert manager.get_azure_credentials()['subscription_id'] == 'sub-1'
+    account['subscription'] = 'sub-2'
+    assert manager.get_azure_credentials()['subscription_id'] == 'sub-1'
+
+
+def test_credentials_rebuilt_after_az_account_set(azure_cli):
+    profile, account = azure_cli
+    manager = CredentialManager(StubConfigLoader())
+
+    assert manager.get_azure_credentials()['subscription_id'] == 'sub-1'
+
+    # 'az account set' rewrites azureProfile.json
+    account['subscription'] = 'sub-2'
+    st = os.stat(profile)
+    os.utime(profile, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert manager.get_azure_credentials()['subscription_id'] == 'sub-2'
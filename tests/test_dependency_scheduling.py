@@ -0,0 +1,101 @@
+"""
+Tests for dependency-aware scheduling in CTFManager._run_for_challenges
+"""
+
+import importlib.util
+import logging
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from lib.challenge import Challenge
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_spec = importlib.util.spec_from_file_location("ctf_manager", ROOT / "ctf-manager.py")
+ctf_manager = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ctf_manager)
+
+
+@pytest.fixture
+def manager():
+    """CTFManager with its lazy components stubbed out (no config, logs or Terraform)"""
+    manager = ctf_manager.CTFManager.__new__(ctf_manager.CTFManager)
+    manager.logger = logging.getLogger("test-ctf-manager")
+    manager._output_lock = threading.Lock()
+    manager.__dict__['_challenges'] = {}
+    manager.__dict__['terraform_manager'] = None
+    return manager
+
+
+def make_challenge(name, dependencies=()):
+    return Challenge(name, {'provider': 'azure', 'dependencies': list(dependencies)}, ROOT)
+
+
+def recording_action(events, results=None, delay=0.05):
+    """Action recording (start/end, name) events; fails challenges mapped to False"""
+    lock = threading.Lock()
+
+    def action(name, **kwargs):
+        with lock:
+            events.append(('start', name))
+        time.sleep(delay)
+        with lock:
+            events.append(('end', name))
+        return (results or {}).get(name, True)
+
+    return action
+
+
+def test_dependent_starts_after_dependency_finishes(manager):
+    # Dependent listed first so the batch order alone would get it wrong
+    challenges = [
+        make_challenge('challenge-03-azure-only', ['challenge-01-azure-only']),
+        make_challenge('challenge-01-azure-only')
+    ]
+    events = []
+
+    count = manager._run_for_challenges(recording_action(events), challenges, "deploy",
+                                        parallelism=4)
+
+    assert count == 2
+    assert events.index(('end', 'challenge-01-azure-only')) < \
+        events.index(('start', 'challenge-03-azure-only'))
+
+
+def test_dependent_skipped_when_dependency_fails(manager):
+    challenges = [
+        make_challenge('challenge-01-azure-only'),
+        make_challenge('challenge-03-azure-only', ['challenge-01-azure-only'])
+    ]
+    events = []
+    action = recording_action(events, results={'challenge-01-azure-only': False})
+
+    count = manager._run_for_challenges(action, challenges, "deploy", parallelism=4)
+
+    assert count == 0
+    assert ('start', 'challenge-03-azure-only') not in events
+
+
+def test_destroy_runs_dependents_first(manager):
+    challenges = [
+        make_challenge('challenge-01-azure-only'),
+        make_challenge('challenge-03-azure-only', ['challenge-01-azure-only'])
+    ]
+    events = []
+
+    count = manager._run_for_challenges(recording_action(events), challenges, "destroy",
+                                        parallelism=4, reverse_dependencies=True)
+
+    assert count == 2
+    assert events.index(('end', 'challenge-03-azure-only')) < \
+        events.index(('start', 'challenge-01-azure-only'))
+
+
+def test_dependencies_outside_batch_are_ignored(manager):
+    challenges = [make_challenge('challenge-03-azure-only', ['challenge-01-azure-only'])]
+    events = []
+
+    assert manager._run_for_challenges(recording_action(events), challenges, "deploy") == 1